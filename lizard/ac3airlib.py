@@ -2,14 +2,59 @@
 Library of functions to simplify access to ac3airborne flight segments.
 """
 
+import operator
+from functools import lru_cache
+
 import ac3airborne
 import numpy as np
 import pandas as pd
 import xarray as xr
 
-META = ac3airborne.get_flight_segments()
+_META = None
+
+
+def _get_meta():
+    """
+    Loads the ac3airborne flight segments on first use. Loading at import
+    time would make every lizard import pay the fetch cost.
+    """
+
+    global _META
+
+    if _META is None:
+        _META = ac3airborne.get_flight_segments()
+
+    return _META
+
+
+@lru_cache(maxsize=None)
+def _flight_table():
+    """
+    Walk the flight segments once and store flight id, mission, platform,
+    and date in parallel numpy arrays for vectorized queries.
+    """
+
+    meta_all = _get_meta()
+
+    ids, flight_missions, platforms, dates = [], [], [], []
+
+    for mission, mission_platforms in meta_all.items():
+        for platform, flights in mission_platforms.items():
+            for flight_id, flight in flights.items():
+                ids.append(flight_id)
+                flight_missions.append(mission)
+                platforms.append(platform)
+                dates.append(flight["date"])
+
+    return (
+        np.array(ids),
+        np.array(flight_missions),
+        np.array(platforms),
+        np.array(dates, dtype="datetime64[D]"),
+    )
 
 
+@lru_cache(maxsize=None)
 def meta(flight_id):
     """
     Jump directly to flight
@@ -17,9 +62,23 @@ def meta(flight_id):
 
     mission, platform, name = flight_id.split("_")
 
-    return META[mission][platform][flight_id]
+    return _get_meta()[mission][platform][flight_id]
 
 
+def _with_dt64(segment):
+    """
+    Shallow copy of segment with start/end pre-converted to np.datetime64,
+    so the ISO strings are parsed once at ingest instead of per lookup.
+    """
+
+    segment = dict(segment)
+    segment["_start_dt64"] = np.datetime64(segment["start"])
+    segment["_end_dt64"] = np.datetime64(segment["end"])
+
+    return segment
+
+
+@lru_cache(maxsize=None)
 def segments_plain(flight_id):
     """
     Write segments into plain list.
@@ -32,25 +91,33 @@ def segments_plain(flight_id):
     for segment in flight["segments"]:
         if "parts" in segment.keys():
             for part in segment["parts"]:
-                s.append(part)
+                s.append(_with_dt64(part))
         else:
-            s.append(segment)
+            s.append(_with_dt64(segment))
 
     return s
 
 
+@lru_cache(maxsize=None)
+def _segment_lookup(segment_id):
+    """
+    Start and end time of flight segment as np.datetime64
+    """
+
+    flight_id = "_".join(segment_id.split("_")[:3])
+    segment = segments_dict(flight_id)[segment_id]
+
+    return (segment["_start_dt64"], segment["_end_dt64"])
+
+
 def segment_slice(segment_id):
     """
     Slices from start to end of flight segment
     """
 
-    flight_id = "_".join(segment_id.split("_")[:3])
-    segments = segments_dict(flight_id)
-    segment = segments[segment_id]
+    start, end = _segment_lookup(segment_id)
 
-    return slice(
-        np.datetime64(segment["start"]), np.datetime64(segment["end"])
-    )
+    return slice(start, end)
 
 
 def segment_times(segment_id):
@@ -58,13 +125,10 @@ def segment_times(segment_id):
     Slices from start to end of flight segment
     """
 
-    flight_id = "_".join(segment_id.split("_")[:3])
-    segments = segments_dict(flight_id)
-    segment = segments[segment_id]
-
-    return (np.datetime64(segment["start"]), np.datetime64(segment["end"]))
+    return _segment_lookup(segment_id)
 
 
+@lru_cache(maxsize=None)
 def segments_dict(flight_id):
     """
     Write flight segments into a plain dictionary, with segment id as key.
@@ -79,11 +143,11 @@ def segments_dict(flight_id):
         if "parts" in segment.keys():
             for part in segment["parts"]:
                 if "segment_id" in part.keys():
-                    s[part["segment_id"]] = part
+                    s[part["segment_id"]] = _with_dt64(part)
 
         else:
             if "segment_id" in segment.keys():
-                s[segment["segment_id"]] = segment
+                s[segment["segment_id"]] = _with_dt64(segment)
 
     return s
 
@@ -93,24 +157,29 @@ def remove_segments(ds, flight_id, segment_names):
     Remove certain flight segments from dataset.
     """
 
+    # plain set intersection beats np.isin for the handful of kinds per
+    # segment
+    names_set = frozenset(segment_names)
+
     s_flt = [
         s
         for s in segments_plain(flight_id)
-        if not np.any(np.isin(s["kinds"], segment_names))
+        if names_set.isdisjoint(s["kinds"])
     ]
 
-    ds_sel = None
+    if not s_flt:
+        return None
 
-    for i, s in enumerate(s_flt):
-        if i == 0:
-            ds_sel = ds.sel(time=slice(s["start"], s["end"]))
+    # concatenate all segment slices at once instead of growing the dataset
+    # segment by segment
+    pieces = [
+        ds.sel(time=slice(s["_start_dt64"], s["_end_dt64"])) for s in s_flt
+    ]
 
-        else:
-            ds_sel = xr.concat(
-                [ds_sel, ds.sel(time=slice(s["start"], s["end"]))], dim="time"
-            )
+    if len(pieces) == 1:
+        return pieces[0]
 
-    return ds_sel
+    return xr.concat(pieces, dim="time")
 
 
 def print_segments(flight_id):
@@ -130,14 +199,8 @@ def print_segments(flight_id):
         )
 
 
-def profiles(flight_id):
-    """
-    Returns list of segments that are either ascents or descents.
-    """
-
-    flight = meta(flight_id)
-
-    segment_kinds = [
+_PROFILE_KINDS = frozenset(
+    {
         "major_ascent",
         "major_descent",
         "small_ascent",
@@ -151,23 +214,33 @@ def profiles(flight_id):
         "stairstep_pattern",
         "ascent",
         "descent",
-    ]
+    }
+)
+
+
+@lru_cache(maxsize=None)
+def profiles(flight_id):
+    """
+    Returns list of segments that are either ascents or descents.
+    """
+
+    flight = meta(flight_id)
 
     segments = []
     for segment in flight["segments"]:
-        for kind in segment["kinds"]:
-            if kind in segment_kinds:
-                parts = segment.get("parts")
-                if parts:
-                    for part in parts:
-                        for kind in part["kinds"]:
-                            if kind in segment_kinds:
-                                segments.append(part)
-                else:
-                    segments.append(segment)
+        if _PROFILE_KINDS.isdisjoint(segment["kinds"]):
+            continue
+
+        parts = segment.get("parts")
+        if parts:
+            segments.extend(
+                p for p in parts if not _PROFILE_KINDS.isdisjoint(p["kinds"])
+            )
+        else:
+            segments.append(segment)
 
     # sort segments
-    segments.sort(key=lambda segments: segments.get("segment_id"))
+    segments.sort(key=operator.itemgetter("segment_id"))
 
     return segments
 
@@ -177,14 +250,14 @@ def flights_of_day(day):
     Returns list of flights that took place at a certain day.
     """
 
-    for mission in list(META):
-        for platform in list(META[mission]):
-            for flight_id in list(META[mission][platform]):
-                flight = META[mission][platform][flight_id]
-                if pd.Timestamp(flight["date"]) == pd.Timestamp(day):
-                    yield flight_id
+    day = np.datetime64(pd.Timestamp(day).date(), "D")
+
+    ids, _, _, dates = _flight_table()
+
+    return iter(ids[dates == day].tolist())
 
 
+@lru_cache(maxsize=None)
 def day_of_flight(flight_id):
     """
     Returns list of flights that took place at a certain day.
@@ -201,30 +274,58 @@ def get_all_flights(mission, platform):
     Get research flights of a specific aircraft and mission.
     """
 
-    if type(mission) == str:
-        mission = [mission]
+    if isinstance(mission, str):
+        mission = (mission,)
 
-    if type(platform) == str:
-        platform = [platform]
+    if isinstance(platform, str):
+        platform = (platform,)
 
-    flight_ids = [
-        f
-        for m in list(META)
-        for p in list(META[m])
-        for f in list(META[m][p])
-        if m in list(mission)
-        if p in list(platform)
-    ]
-
-    if "HALO-AC3_HALO_RF01" in flight_ids:
-        flight_ids.remove("HALO-AC3_HALO_RF01")  # transfer flight
-
-    if "HALO-AC3_HALO_RF00" in flight_ids:
-        flight_ids.remove("HALO-AC3_HALO_RF00")  # test flight
-
-    return flight_ids
+    ids, flight_missions, platforms, _ = _flight_table()
 
+    mask = np.isin(flight_missions, list(mission)) & np.isin(
+        platforms, list(platform)
+    )
 
+    return [f for f in ids[mask].tolist() if f not in _HALO_EXCLUDE]
+
+
+# transfer flight (RF01) and test flight (RF00)
+_HALO_EXCLUDE = frozenset({"HALO-AC3_HALO_RF00", "HALO-AC3_HALO_RF01"})
+
+# flights without dropsonde measurements
+_DROPSONDE_EXCLUDE = frozenset(
+    {
+        "ACLOUD_P5_RF04",
+        "ACLOUD_P5_RF08",
+        "ACLOUD_P5_RF15",
+        "ACLOUD_P5_RF25",
+        "AFLUX_P5_RF03",
+        "AFLUX_P5_RF11",
+        "AFLUX_P5_RF12",
+        "AFLUX_P5_RF13",
+        "AFLUX_P5_RF14",
+        "HALO-AC3_P5_RF06",
+        "MOSAiC-ACA_P5_RF02",
+        "MOSAiC-ACA_P5_RF03",
+        "MOSAiC-ACA_P5_RF04",
+    }
+)
+
+# flights without amali measurements
+_AMALI_EXCLUDE = frozenset(
+    {
+        "ACLOUD_P5_RF15",
+        "AFLUX_P5_RF02",
+        "MOSAiC-ACA_P5_RF02",
+        "MOSAiC-ACA_P5_RF03",
+        "MOSAiC-ACA_P5_RF09",  # laser off throughout the flight
+        "HALO-AC3_P5_RF02",
+        "HALO-AC3_P5_RF06",
+    }
+)
+
+
+@lru_cache(maxsize=None)
 def get_dropsonde_flight_ids():
     """
     Returns list of flights ids where dropsondes are available.
@@ -234,23 +335,10 @@ def get_dropsonde_flight_ids():
         mission=["ACLOUD", "AFLUX", "MOSAiC-ACA", "HALO-AC3"], platform="P5"
     )
 
-    flight_ids.remove("ACLOUD_P5_RF04")
-    flight_ids.remove("ACLOUD_P5_RF08")
-    flight_ids.remove("ACLOUD_P5_RF15")
-    flight_ids.remove("ACLOUD_P5_RF25")
-    flight_ids.remove("AFLUX_P5_RF03")
-    flight_ids.remove("AFLUX_P5_RF11")
-    flight_ids.remove("AFLUX_P5_RF12")
-    flight_ids.remove("AFLUX_P5_RF13")
-    flight_ids.remove("AFLUX_P5_RF14")
-    flight_ids.remove("HALO-AC3_P5_RF06")
-    flight_ids.remove("MOSAiC-ACA_P5_RF02")
-    flight_ids.remove("MOSAiC-ACA_P5_RF03")
-    flight_ids.remove("MOSAiC-ACA_P5_RF04")
-
-    return flight_ids
+    return [f for f in flight_ids if f not in _DROPSONDE_EXCLUDE]
 
 
+@lru_cache(maxsize=None)
 def get_amali_flight_ids(only_downward=False):
     """
     Returns list of all ac3airborne flight ids, where amali measured
@@ -260,20 +348,15 @@ def get_amali_flight_ids(only_downward=False):
         mission=["ACLOUD", "AFLUX", "MOSAiC-ACA", "HALO-AC3"], platform="P5"
     )
 
-    flight_ids.remove("ACLOUD_P5_RF15")
-    flight_ids.remove("AFLUX_P5_RF02")
-    flight_ids.remove("MOSAiC-ACA_P5_RF02")
-    flight_ids.remove("MOSAiC-ACA_P5_RF03")
-    flight_ids.remove("MOSAiC-ACA_P5_RF09")  # laser off throughout the flight
-    flight_ids.remove("HALO-AC3_P5_RF02")
-    flight_ids.remove("HALO-AC3_P5_RF06")
+    exclude = _AMALI_EXCLUDE
 
     if only_downward:
-        flight_ids.remove("ACLOUD_P5_RF10")
+        exclude = exclude | {"ACLOUD_P5_RF10"}
 
-    return flight_ids
+    return [f for f in flight_ids if f not in exclude]
 
 
+@lru_cache(maxsize=None)
 def get_mirac_a_flight_ids():
     """
     Returns list of all ac3airborne flight ids, where mirac-a measured.
@@ -285,11 +368,10 @@ def get_mirac_a_flight_ids():
         mission=["ACLOUD", "AFLUX", "MOSAiC-ACA", "HALO-AC3"], platform="P5"
     )
 
-    flight_ids.remove("ACLOUD_P5_RF13")
-
-    return flight_ids
+    return [f for f in flight_ids if f != "ACLOUD_P5_RF13"]
 
 
+@lru_cache(maxsize=None)
 def get_mirac_p_hatpro_flight_ids():
     """
     Returns list of all ac3airborne flight ids, where mirac-p/hatpro measured.
@@ -299,6 +381,4 @@ def get_mirac_p_hatpro_flight_ids():
         mission=["ACLOUD", "AFLUX", "MOSAiC-ACA", "HALO-AC3"], platform="P5"
     )
 
-    flight_ids.remove("MOSAiC-ACA_P5_RF03")
-
-    return flight_ids
+    return [f for f in flight_ids if f != "MOSAiC-ACA_P5_RF03"]
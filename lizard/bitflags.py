@@ -4,6 +4,29 @@ Read and write bit flags with xarray.
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+
+except ImportError:
+    HAS_NUMBA = False
+
+# numba path pays off only for large masks, where the streaming kernel
+# avoids the packbits intermediate
+_NUMBA_THRESHOLD = 1 << 16
+
+if HAS_NUMBA:
+
+    @njit(parallel=True, cache=True)
+    def _pack_2d(boolean_mask, out):
+        n_features, n_samples = boolean_mask.shape
+        for i in prange(n_samples):
+            b = np.uint8(0)
+            for f in range(n_features):
+                b |= np.uint8(boolean_mask[f, i] & 1) << np.uint8(f)
+            out[i] = b
+
 
 def pack_bit_mask(boolean_mask):
     """
@@ -19,22 +42,35 @@ def pack_bit_mask(boolean_mask):
     bit_mask: uint8 bit values.
     """
 
-    shape = list(boolean_mask.shape)
-    shape[0] = 8
-    mask = np.zeros(shape, dtype="uint8")
-    mask[: boolean_mask.shape[0], ...] = boolean_mask
-    bit_mask = np.packbits(mask, axis=0, bitorder="little")[0, ...]
+    if (
+        HAS_NUMBA
+        and boolean_mask.ndim == 2
+        and boolean_mask.size > _NUMBA_THRESHOLD
+    ):
+        bit_mask = np.empty(boolean_mask.shape[1], dtype="uint8")
+        _pack_2d(
+            np.ascontiguousarray(boolean_mask, dtype="uint8"), bit_mask
+        )
+
+        return bit_mask
+
+    # np.packbits pads short axes with zeros itself, no need to copy the
+    # masks into a zeroed 8-lane array first
+    bit_mask = np.packbits(
+        boolean_mask.astype("uint8", copy=False), axis=0, bitorder="little"
+    )[0, ...]
 
     return bit_mask
 
 
-def unpack_bit_mask(bit_mask):
+def unpack_bit_mask(bit_mask, count=None):
     """
 
 
     Parameters
     ----------
     bit_mask: uint8 bit values.
+    count: number of flags to unpack (all eight bits if None).
 
     Returns
     -------
@@ -42,7 +78,7 @@ def unpack_bit_mask(bit_mask):
     """
 
     boolean_mask = np.unpackbits(
-        bit_mask[np.newaxis, ...], axis=0, bitorder="little"
+        bit_mask[np.newaxis, ...], axis=0, bitorder="little", count=count
     )
 
     return boolean_mask
@@ -66,7 +102,9 @@ def write_flag_xarray(ds, bool_vars, bool_meanings, bit_mask_name, drop=True):
     xarray Dataset with bit mask
     """
 
-    bit_mask_values = pack_bit_mask(ds[bool_vars].to_array().values)
+    bit_mask_values = pack_bit_mask(
+        np.stack([ds[v].values for v in bool_vars], axis=0)
+    )
     ds[bit_mask_name] = (ds[bool_vars[0]].dims, bit_mask_values)
     ds[bit_mask_name].attrs["flag_meanings"] = " ".join(bool_meanings)
     ds[bit_mask_name].attrs["flag_masks"] = 2 ** np.arange(
@@ -74,7 +112,8 @@ def write_flag_xarray(ds, bool_vars, bool_meanings, bit_mask_name, drop=True):
     )
 
     if drop:
-        ds = ds.drop(bool_vars)
+        for v in bool_vars:
+            del ds[v]
 
     return ds
 
@@ -100,13 +139,19 @@ def read_flag_xarray(ds, bit_mask_name="surf_type", drop=True):
 
     flag_meanings = ds[bit_mask_name].attrs["flag_meanings"].split(" ")
     # flag_masks = ds[bit_mask_name].attrs['flag_masks']
-    boolean_mask = unpack_bit_mask(ds[bit_mask_name].values)
+    bit_mask = ds[bit_mask_name].values
+    dims = ds[bit_mask_name].dims
 
+    # extract each flag with a shift+and instead of unpacking all eight
+    # bit planes at once
     for i, flag_meaning in enumerate(flag_meanings):
-        ds[flag_meaning] = (ds[bit_mask_name].dims, boolean_mask[i, ...])
+        ds[flag_meaning] = (
+            dims,
+            ((bit_mask >> np.uint8(i)) & np.uint8(1)).astype(bool),
+        )
 
     # remove bit mask
     if drop:
-        ds = ds.drop(bit_mask_name)
+        del ds[bit_mask_name]
 
     return ds
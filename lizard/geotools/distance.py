@@ -3,8 +3,23 @@ Distance calculator.
 """
 
 
-import cartopy.crs as ccrs
+from functools import lru_cache
+
 import numpy as np
+from pyproj import Transformer
+
+
+@lru_cache(maxsize=None)
+def _transformer(epsg=None, utm=None):
+    """
+    Cached transformer from geographic coordinates to the projected
+    coordinate system given by EPSG code or UTM zone (northern hemisphere).
+    """
+
+    if epsg is None:
+        epsg = 32600 + int(utm)
+
+    return Transformer.from_crs("EPSG:4326", f"EPSG:{epsg}", always_xy=True)
 
 
 def distance(lat, lon, lat0, lon0, lat1, lon1, utm=None, epsg=None):
@@ -41,28 +56,23 @@ def distance(lat, lon, lat0, lon0, lat1, lon1, utm=None, epsg=None):
 
     assert epsg is None or utm is None
 
-    # define coordinate systems
-    if epsg is None:
-        cs_proj = ccrs.UTM(zone=utm)
-
-    else:
-        cs_proj = ccrs.epsg(epsg)
-
-    cs_geog = ccrs.PlateCarree()
+    transformer = _transformer(epsg=epsg, utm=utm)
 
-    # start and end points of track
-    p0 = np.array([[lon0], [lat0]])
-    p1 = np.array([[lon1], [lat1]])
+    lon = np.atleast_1d(lon)
+    lat = np.atleast_1d(lat)
 
-    # project all coordinates to (x, y, z)
-    p0_p = cs_proj.transform_points(x=p0[0, :], y=p0[1, :], src_crs=cs_geog)
-    p1_p = cs_proj.transform_points(x=p1[0, :], y=p1[1, :], src_crs=cs_geog)
-    pn_p = cs_proj.transform_points(x=lon, y=lat, src_crs=cs_geog)
+    # project start point, end point, and target points in one batch
+    x, y = transformer.transform(
+        np.concatenate(([lon0, lon1], lon)),
+        np.concatenate(([lat0, lat1], lat)),
+    )
 
-    # calculate unit vector along track
-    e_d = (p1_p - p0_p) / np.linalg.norm(p1_p - p0_p, axis=1)
+    # project vector from start point to target points along axis of track,
+    # normalizing by the track length; work on the flat x/y arrays
+    # directly instead of stacking an (N, 2) point array
+    dx = x[1] - x[0]
+    dy = y[1] - y[0]
 
-    # project vector from start point to target points along axis of track
-    dist = np.dot((pn_p - p0_p), e_d.T)[..., 0]
+    dist = ((x[2:] - x[0]) * dx + (y[2:] - y[0]) * dy) / np.hypot(dx, dy)
 
     return dist
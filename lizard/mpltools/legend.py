@@ -2,10 +2,25 @@
 Tools for matplotlib legend
 """
 
+from functools import lru_cache
+
 import matplotlib.colors as mcolors
 import numpy as np
 
 
+@lru_cache(maxsize=32)
+def _scale_template(width, step):
+    """
+    Scale bar bin centers relative to the lower left corner and the
+    checkerboard colors, cached per (width, step) in meters.
+    """
+
+    x_rel = np.arange(0, width, step) + step / 2
+    c = np.tile([0, 1], (2, int(len(x_rel) / 2)))
+
+    return x_rel, c
+
+
 def fancy_legend(ax, legend_params):
     """
     Removes markers and colors label in marker color
@@ -23,22 +38,18 @@ def fancy_legend(ax, legend_params):
     handles = leg.legendHandles
     texts = leg.get_texts()
 
-    for i in range(len(handles)):
-        # get color of handle
-        try:
-            color = handles[i].get_c()
-
-        except AttributeError:
-            color = handles[i].get_fc()
+    for handle, text in zip(handles, texts):
+        # get color of handle (line color if present, else face color)
+        color = getattr(handle, "get_c", handle.get_fc)()
 
         if isinstance(color, np.ndarray):
             color = mcolors.to_hex(color)
 
         # make handle invisible
-        handles[i].set_visible(False)
+        handle.set_visible(False)
 
         # change color of text to color of handle
-        texts[i].set_color(color)
+        text.set_color(color)
 
 
 def add_scale(ax, width, step, proj, annotation_params=dict()):
@@ -78,10 +89,9 @@ def add_scale(ax, width, step, proj, annotation_params=dict()):
 
     height = 0.1 * width
     y1 = y0 + height
-    x1 = x0 + width
-    x = np.arange(x0, x1, step) + step / 2
+    x_rel, c = _scale_template(width, step)
+    x = x0 + x_rel
     y = np.array([y0, y1])
-    c = np.array([[0, 1] * int(len(x) / 2), [0, 1] * int(len(x) / 2)])
 
     ax.annotate(
         f"{int(width*1e-3)} km",
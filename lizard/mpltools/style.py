@@ -2,12 +2,15 @@
 Definition of styles and constants for this project.
 """
 
+import types
+
 import matplotlib as mpl
 import matplotlib.colors as mcolors
 import numpy as np
 
 __all__ = [
     "missions",
+    "mission_of",
     "sensors",
     "viewing_angles",
     "platform_colors",
@@ -19,6 +22,7 @@ __all__ = [
     "hamp_cols",
     "mirac_hatpro_cols",
     "mirac_cols",
+    "channel_color_array",
 ]
 
 # matplotlib style
@@ -49,6 +53,26 @@ missions = {
     },
 }
 
+# mission bounds as typed arrays for vectorized date queries
+_MISSION_NAMES = tuple(missions)
+_MISSION_STARTS = np.array(
+    [missions[m]["start"] for m in _MISSION_NAMES], dtype="datetime64[D]"
+)
+_MISSION_ENDS = np.array(
+    [missions[m]["end"] for m in _MISSION_NAMES], dtype="datetime64[D]"
+)
+
+
+def mission_of(date):
+    """
+    Returns the mission that covers the given date, or None.
+    """
+
+    date = np.datetime64(date, "D")
+    idx = np.flatnonzero((_MISSION_STARTS <= date) & (date <= _MISSION_ENDS))
+
+    return _MISSION_NAMES[idx[0]] if idx.size else None
+
 # instrumentation
 sensors = {  # sensors for each campaign
     "ACLOUD": {"P5": dict(sensor1="MiRAC-A", sensor2="MiRAC-P")},
@@ -97,47 +121,49 @@ viewing_angles = {  # channel viewing angles for each campaign by sensor order
 }
 
 # colors
+def _sample_hex(colors, ncol):
+    """
+    Samples ncol hex colors evenly from a linear colormap defined by the
+    given (position, color) anchors.
+    """
+
+    cmap = mcolors.LinearSegmentedColormap.from_list("", colors)
+
+    return [mcolors.to_hex(c) for c in cmap(np.linspace(0, 1, ncol))]
+
+
 # colormap for 22 GHz
-ncol = 7
-norm = mcolors.Normalize(0, 1)
-colors = [
-    [norm(0), "#BFAA00"],
-    [norm(0.33), "#2CA400"],
-    [norm(0.67), "#00776A"],
-    [norm(1.0), "#00467B"],
-]
-cmap = mcolors.LinearSegmentedColormap.from_list("", colors)
-cmap_22ghz = [
-    mcolors.to_hex(cmap(i)) for i in np.linspace(0, 255, ncol).astype("int")
-]
+cmap_22ghz = _sample_hex(
+    [
+        [0, "#BFAA00"],
+        [0.33, "#2CA400"],
+        [0.67, "#00776A"],
+        [1.0, "#00467B"],
+    ],
+    ncol=7,
+)
 
 # colormap for 56 GHz
-ncol = 7
-norm = mcolors.Normalize(0, 1)
-colors = [
-    [norm(0), "#BFAA00"],
-    [norm(0.33), "#2CA400"],
-    [norm(0.67), "#00776A"],
-    [norm(1.0), "#112383"],
-]
-cmap = mcolors.LinearSegmentedColormap.from_list("", colors)
-cmap_56ghz = [
-    mcolors.to_hex(cmap(i)) for i in np.linspace(0, 255, ncol).astype("int")
-]
+cmap_56ghz = _sample_hex(
+    [
+        [0, "#BFAA00"],
+        [0.33, "#2CA400"],
+        [0.67, "#00776A"],
+        [1.0, "#112383"],
+    ],
+    ncol=7,
+)
 
 # colormap for 183 GHz
-ncol = 6
-norm = mcolors.Normalize(0, 1)
-colors = [
-    [norm(0), "#BF7F00"],
-    [norm(0.33), "#2CA400"],
-    [norm(0.67), "#00776A"],
-    [norm(1.0), "#00467B"],
-]
-cmap = mcolors.LinearSegmentedColormap.from_list("", colors)
-cmap_183ghz = [
-    mcolors.to_hex(cmap(i)) for i in np.linspace(0, 255, ncol).astype("int")
-]
+cmap_183ghz = _sample_hex(
+    [
+        [0, "#BF7F00"],
+        [0.33, "#2CA400"],
+        [0.67, "#00776A"],
+        [1.0, "#00467B"],
+    ],
+    ncol=6,
+)
 
 # individual frequencies coarse (use from label strings)
 rad_cols_coarse = {
@@ -340,3 +366,35 @@ pol_markers = {
 
 # k-means cluster colors
 kmeans_colors = {1: "#2E4272", 2: "#FFB631", 3: "#479030", 4: "#BA459D"}
+
+
+def channel_color_array(cols):
+    """
+    Converts an integer-keyed color dict to an object array indexed by
+    channel number, so per-point lookups in plotting loops are array
+    accesses instead of hash probes.
+    """
+
+    arr = np.empty(max(cols) + 1, dtype=object)
+    for k, v in cols.items():
+        arr[k] = v
+
+    return arr
+
+
+# freeze the lookup tables against accidental mutation; lookups are as
+# fast as on a plain dict
+missions = types.MappingProxyType(missions)
+sensors = types.MappingProxyType(sensors)
+viewing_angles = types.MappingProxyType(viewing_angles)
+rad_cols_coarse = types.MappingProxyType(rad_cols_coarse)
+mirac_cols = types.MappingProxyType(mirac_cols)
+mirac_hatpro_cols = types.MappingProxyType(mirac_hatpro_cols)
+hamp_cols = types.MappingProxyType(hamp_cols)
+rad_cols = types.MappingProxyType(rad_cols)
+flight_colors = types.MappingProxyType(flight_colors)
+flight_colors2 = types.MappingProxyType(flight_colors2)
+platform_colors = types.MappingProxyType(platform_colors)
+sensor_colors = types.MappingProxyType(sensor_colors)
+pol_markers = types.MappingProxyType(pol_markers)
+kmeans_colors = types.MappingProxyType(kmeans_colors)
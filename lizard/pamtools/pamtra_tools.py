@@ -21,6 +21,69 @@ import numpy as np
 import pandas as pd
 import xarray as xr
 
+# pamtra output dimensions
+_DIM_2D = ("grid_x", "grid_y")
+_DIM_3D = ("grid_x", "grid_y", "outlevel")
+_DIM_3D_HYDRO = ("grid_x", "grid_y", "hydro_class")
+_DIM_5D = ("grid_x", "grid_y", "polarization", "frequency", "angle")
+_DIM_6D = (
+    "grid_x",
+    "grid_y",
+    "outlevel",
+    "angle",
+    "frequency",
+    "polarization",
+)
+
+# static split of the fixed 32-angle pamtra grid into up/down halves; the
+# first 16 angles are upwelling radiance, the last 16 downwelling, and both
+# halves carry the same descending incidence-angle labels
+_ANG_SLICE_UP = slice(None, 16)
+_ANG_SLICE_DOWN = slice(None, 15, -1)
+_DIRECTION_INDEX = pd.Index(["up", "down"], name="direction")
+
+# variables copied directly from the pam.p dictionary: name -> (dims, attrs)
+_PAM_P_VARS = {
+    "model_i": (_DIM_2D, dict(long_name="model grid i-direction")),
+    "model_j": (_DIM_2D, dict(long_name="model grid j-direction")),
+    "nlyrs": (_DIM_2D, dict(long_name="number of vertical layers")),
+    "lon": (_DIM_2D, dict(long_name="longitude", units="deg")),
+    "lat": (_DIM_2D, dict(long_name="latitude", units="deg")),
+    "sfc_type": (
+        _DIM_2D,
+        dict(
+            long_name="surface type",
+            flag_values=np.array([0, 1]),
+            flag_meanings=np.array(["water", "land"], dtype="str"),
+        ),
+    ),
+    "groundtemp": (_DIM_2D, dict(long_name="ground temperature", units="K")),
+    "sfc_salinity": (
+        _DIM_2D,
+        dict(long_name="sea surface salinity", units="psu"),
+    ),
+    "sfc_sif": (_DIM_2D, dict(long_name="surface sea ice fraction")),
+    "sfc_slf": (_DIM_2D, dict(long_name="surface sea-land fraction")),
+    "sfc_model": (_DIM_2D, dict(long_name="surface model")),
+    "wind10u": (
+        _DIM_2D,
+        dict(long_name="u-wind at 10 m height", units="m s^-1"),
+    ),
+    "wind10v": (
+        _DIM_2D,
+        dict(long_name="v-wind at 10 m height", units="m s^-1"),
+    ),
+    "iwv": (
+        _DIM_2D,
+        dict(long_name="integrated water vapor", units="kg m^-2"),
+    ),
+    "hydro_wp": (
+        _DIM_3D_HYDRO,
+        dict(long_name="integrated hydrometeor content", units="kg m^-2"),
+    ),
+    "obs_height": (_DIM_3D, dict(long_name="observation height", units="m")),
+}
+
 
 def pam_to_xarray(pam, split_angle=True):
     """
@@ -78,126 +141,37 @@ def pam_to_xarray(pam, split_angle=True):
     ds_pam["polarization"].attrs = dict()
     ds_pam["hydro_class"].attrs = dict(long_name="hydrometeor class")
 
-    # variables
-    dim_2d = ("grid_x", "grid_y")
-    dim_3d = ("grid_x", "grid_y", "outlevel")
-    # dim_3d_lev = ('grid_x', 'grid_y', 'lev')
-    dim_3d_hydro = ("grid_x", "grid_y", "hydro_class")
-    dim_5d = ("grid_x", "grid_y", "polarization", "frequency", "angle")
-    dim_6d = (
-        "grid_x",
-        "grid_y",
-        "outlevel",
-        "angle",
-        "frequency",
-        "polarization",
-    )
-
-    # 2d variables
-    ds_pam["model_i"] = (dim_2d, pam.p["model_i"])
-    ds_pam["model_i"].attrs = dict(long_name="model grid i-direction")
-
-    ds_pam["model_j"] = (dim_2d, pam.p["model_j"])
-    ds_pam["model_j"].attrs = dict(long_name="model grid j-direction")
-
-    ds_pam["nlyrs"] = (dim_2d, pam.p["nlyrs"])
-    ds_pam["nlyrs"].attrs = dict(long_name="number of vertical layers")
+    # variables copied directly from the pam.p dictionary
+    for name, (dims, attrs) in _PAM_P_VARS.items():
+        ds_pam[name] = (dims, pam.p[name])
+        ds_pam[name].attrs = dict(attrs)
 
+    # unix seconds reinterpreted as datetime64[s] without the epoch-offset
+    # intermediate
     ds_pam["time"] = (
-        dim_2d,
-        np.datetime64("1970-01-01")
-        + pam.p["unixtime"].astype("timedelta64[s]"),
+        _DIM_2D,
+        pam.p["unixtime"].astype("int64", copy=False).view("datetime64[s]"),
     )
     ds_pam["time"].attrs = dict(long_name="time")
     ds_pam["time"].encoding = dict(units="seconds since 1970-01-01 00:00:00")
 
-    ds_pam["lon"] = (dim_2d, pam.p["lon"])
-    ds_pam["lon"].attrs = dict(long_name="longitude", units="deg")
-
-    ds_pam["lat"] = (dim_2d, pam.p["lat"])
-    ds_pam["lat"].attrs = dict(long_name="latitude", units="deg")
-
-    ds_pam["sfc_type"] = (dim_2d, pam.p["sfc_type"])
-    ds_pam["sfc_type"].attrs = dict(
-        long_name="surface type",
-        flag_values=np.array([0, 1]),
-        flag_meanings=np.array(["water", "land"], dtype="str"),
-    )
-
-    ds_pam["groundtemp"] = (dim_2d, pam.p["groundtemp"])
-    ds_pam["groundtemp"].attrs = dict(
-        long_name="ground temperature", units="K"
-    )
-
-    ds_pam["sfc_salinity"] = (dim_2d, pam.p["sfc_salinity"])
-    ds_pam["sfc_salinity"].attrs = dict(
-        long_name="sea surface salinity", units="psu"
-    )
-
-    ds_pam["sfc_sif"] = (dim_2d, pam.p["sfc_sif"])
-    ds_pam["sfc_sif"].attrs = dict(long_name="surface sea ice fraction")
-
-    ds_pam["sfc_slf"] = (dim_2d, pam.p["sfc_slf"])
-    ds_pam["sfc_slf"].attrs = dict(long_name="surface sea-land fraction")
-
-    ds_pam["sfc_model"] = (dim_2d, pam.p["sfc_model"])
-    ds_pam["sfc_model"].attrs = dict(long_name="surface model")
-
-    ds_pam["sfc_refl"] = (dim_2d, np.array(pam.p["sfc_refl"].astype("str")))
+    # fixed-width single-character strings instead of boxed Python objects
+    ds_pam["sfc_refl"] = (_DIM_2D, pam.p["sfc_refl"].astype("<U1"))
     ds_pam["sfc_refl"].attrs = dict(long_name="surface reflection type")
 
-    ds_pam["wind10u"] = (dim_2d, pam.p["wind10u"])
-    ds_pam["wind10u"].attrs = dict(
-        long_name="u-wind at 10 m height", units="m s^-1"
-    )
-
-    ds_pam["wind10v"] = (dim_2d, pam.p["wind10v"])
-    ds_pam["wind10v"].attrs = dict(
-        long_name="v-wind at 10 m height", units="m s^-1"
-    )
-
-    # atmospheric profile
-    # ds_pam['hgt_lev'] = (dim_3d_lev, pam.p['hgt_lev'])
-    # ds_pam['hgt_lev'].attrs = dict(long_name='height', units='m')
-
-    # ds_pam['press_lev'] = (dim_3d_lev, pam.p['press_lev'])
-    # ds_pam['press_lev'].attrs = dict(long_name='pressure', units='Pa')
-
-    # ds_pam['temp_lev'] = (dim_3d_lev, pam.p['temp_lev'])
-    # ds_pam['temp_lev'].attrs = dict(long_name='temperature', units='K')
-
-    # ds_pam['relhum_lev'] = (dim_3d_lev, pam.p['relhum_lev'])
-    # ds_pam['relhum_lev'].attrs = dict(long_name='relative humidity', units='%')
-
-    # integrated profile variables
-    ds_pam["iwv"] = (dim_2d, pam.p["iwv"])
-    ds_pam["iwv"].attrs = dict(
-        long_name="integrated water vapor", units="kg m^-2"
-    )
-
-    ds_pam["hydro_wp"] = (dim_3d_hydro, pam.p["hydro_wp"])
-    ds_pam["hydro_wp"].attrs = dict(
-        long_name="integrated hydrometeor content", units="kg m^-2"
-    )
-
-    # 3d variables
-    ds_pam["obs_height"] = (dim_3d, pam.p["obs_height"])
-    ds_pam["obs_height"].attrs = dict(
-        long_name="observation height", units="m"
-    )
-
     # 6d variables
-    ds_pam["tb"] = (dim_6d, pam.r["tb"])
+    ds_pam["tb"] = (_DIM_6D, pam.r["tb"])
     ds_pam["tb"].attrs = dict(long_name="brightness temperature", units="K")
 
-    # extend emissivity by upward angles
-    emissivity = np.full(
-        shape=[len(ds_pam[dim]) for dim in dim_5d], fill_value=np.nan
+    # extend emissivity by upward angles; fill only the unused half with
+    # nan and flip via a reversed view instead of np.flip
+    upper = ds_pam["angle"].values > 90
+    emissivity = np.empty(
+        [len(ds_pam[dim]) for dim in _DIM_5D], dtype="float64"
     )
-    emissivity[..., ds_pam["angle"] > 90] = np.flip(
-        pam.r["emissivity"], axis=[4]
-    )
-    ds_pam["emissivity"] = (dim_5d, emissivity)
+    emissivity[..., ~upper] = np.nan
+    emissivity[..., upper] = pam.r["emissivity"][..., ::-1]
+    ds_pam["emissivity"] = (_DIM_5D, emissivity)
     ds_pam["emissivity"].attrs = dict(
         long_name="emissivity", comment="defined for 180 > angle > 90"
     )
@@ -209,7 +183,9 @@ def pam_to_xarray(pam, split_angle=True):
         + f'Git Hash: {pam.r["pamtraHash"]})',
         pamtraVersion=pam.r["pamtraVersion"],
         author=f'{pam.nmlSet["creator"]} (University of Cologne, IGMK)',
-        created=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        created=datetime.datetime.now().isoformat(
+            sep=" ", timespec="seconds"
+        ),
         history="Created with pyPamtra and converted to xarray.Dataset under"
         + f" xarray version {xr.__version__}",
     )
@@ -227,16 +203,27 @@ def pam_to_xarray(pam, split_angle=True):
     )
 
     if split_angle:
-        # split angle dimension into direction and incidence angle dimensions
-        dir_expanded = np.array(["up", "down"], dtype="str").repeat(16)
-        ang_expanded = np.append(
-            ds_pam.angle.values[32:15:-1], ds_pam.angle.values[16:32]
+        # split angle dimension into direction and incidence angle
+        # dimensions; the split is deterministic (first 16 angles are
+        # upwelling radiance, last 16 downwelling), so slice the two halves
+        # directly instead of the slow MultiIndex unstack. Direction and
+        # angle order and the trailing dim placement match the unstack
+        # output exactly
+        ang_inc = ds_pam.angle.values[:15:-1]  # descending, as unstacked
+        ds_pam = ds_pam.rename({"angle": "angle_180"})  # rename angle dim
+        up = ds_pam.isel(angle_180=_ANG_SLICE_UP).assign_coords(
+            angle_180=ang_inc
         )
-        ind = pd.MultiIndex.from_arrays(
-            (dir_expanded, ang_expanded), names=("direction", "angle")
+        down = ds_pam.isel(angle_180=_ANG_SLICE_DOWN).assign_coords(
+            angle_180=ang_inc
         )
-        ds_pam = ds_pam.rename({"angle": "angle_180"})  # rename angle dim
-        ds_pam = ds_pam.assign(angle_180=ind).unstack("angle_180")
+        ds_pam = xr.concat(
+            [up, down],
+            dim=_DIRECTION_INDEX,
+            data_vars="different",
+        )
+        ds_pam = ds_pam.rename({"angle_180": "angle"})
+        ds_pam = ds_pam.transpose(..., "direction", "angle")
 
         ds_pam["direction"].attrs = dict(
             long_name="direction of radiance",
@@ -293,6 +280,15 @@ class PamtraSurface:
 
         self.ds = ds
 
+        # compute the surface masks once; every setter consumes them
+        slf = ds["sfc_slf"].values
+        sif = ds["sfc_sif"].values
+        self._masks = {
+            "ocean": (slf < 0.5) & (sif < 0.5),
+            "land": slf > 0.5,
+            "sea_ice": (slf < 0.5) & (sif > 0.5),
+        }
+
         self.set_sfc_type(kind=kind)
 
         self.set_sfc_model(
@@ -320,19 +316,7 @@ class PamtraSurface:
         A boolean mask with the indices where the surface is present
         """
 
-        if name == "ocean":
-            ix = (self.ds["sfc_slf"] < 0.5) & (self.ds["sfc_sif"] < 0.5)
-
-        elif name == "land":
-            ix = self.ds["sfc_slf"] > 0.5
-
-        elif name == "sea_ice":
-            ix = (self.ds["sfc_slf"] < 0.5) & (self.ds["sfc_sif"] > 0.5)
-
-        else:
-            ix = None
-
-        return ix
+        return self._masks.get(name)
 
     def set_sfc_type(self, kind="natural"):
         """
@@ -356,28 +340,23 @@ class PamtraSurface:
 
         assert kind in ["natural", "idealized"]
 
-        # initialize surface type array
-        self.ds["sfc_type"] = xr.full_like(self.ds["sfc_slf"], fill_value=0)
+        dims = self.ds["sfc_slf"].dims
+        shape = self.ds["sfc_slf"].shape
 
         if kind == "natural":
-            # ocean
-            self.ds["sfc_type"] = xr.where(
-                self.get_surface_mask("land"), 1, self.ds["sfc_type"]
-            )
-
             # land and sea ice
-            self.ds["sfc_type"] = xr.where(
+            sfc_type = np.where(
                 self.get_surface_mask("land")
                 | self.get_surface_mask("sea_ice"),
                 1,
-                self.ds["sfc_type"],
+                0,
             )
 
+            self.ds["sfc_type"] = (dims, sfc_type)
+
         elif kind == "idealized":
             # pamtra will use the fixed emissivity
-            self.ds["sfc_type"] = xr.full_like(
-                self.ds["sfc_type"], fill_value=-9999
-            )
+            self.ds["sfc_type"] = (dims, np.full(shape, -9999))
 
     def set_sfc_model(
         self, ocean="TESSEM2", land="TELSEM2", sea_ice="TESSEM2"
@@ -402,24 +381,18 @@ class PamtraSurface:
             "SSMI": 1,
         }
 
-        # initialize surface model variable
-        self.ds["sfc_model"] = xr.zeros_like(self.ds["sfc_type"])
-
-        # select ocean model
-        self.ds["sfc_model"] = xr.where(
-            self.get_surface_mask("ocean"), models[ocean], self.ds["sfc_model"]
-        )
-
-        # select land model
-        self.ds["sfc_model"] = xr.where(
-            self.get_surface_mask("land"), models[land], self.ds["sfc_model"]
-        )
-
-        # select sea ice model
-        self.ds["sfc_model"] = xr.where(
-            self.get_surface_mask("sea_ice"),
-            models[sea_ice],
-            self.ds["sfc_model"],
+        # classify ocean, land, and sea ice model in a single pass
+        self.ds["sfc_model"] = (
+            self.ds["sfc_type"].dims,
+            np.select(
+                [
+                    self.get_surface_mask("ocean"),
+                    self.get_surface_mask("land"),
+                    self.get_surface_mask("sea_ice"),
+                ],
+                [models[ocean], models[land], models[sea_ice]],
+                default=0,
+            ),
         )
 
     def set_sfc_refl(self, ocean="F", land="F", sea_ice="F"):
@@ -437,22 +410,17 @@ class PamtraSurface:
         sea_ice: reflection type over sea ice
         """
 
-        # initialize the surface reflection field
-        self.ds["sfc_refl"] = xr.full_like(
-            self.ds["sfc_type"], fill_value="F", dtype="str"
-        )
-
-        # set reflection for ocean
-        self.ds["sfc_refl"] = xr.where(
-            self.get_surface_mask("ocean"), ocean, self.ds["sfc_refl"]
-        )
-
-        # set reflection for land
-        self.ds["sfc_refl"] = xr.where(
-            self.get_surface_mask("land"), land, self.ds["sfc_refl"]
-        )
-
-        # set reflection for sea ice
-        self.ds["sfc_refl"] = xr.where(
-            self.get_surface_mask("sea_ice"), sea_ice, self.ds["sfc_refl"]
+        # set reflection for ocean, land, and sea ice in a single pass;
+        # fixed-width single-character strings instead of Python objects
+        self.ds["sfc_refl"] = (
+            self.ds["sfc_type"].dims,
+            np.select(
+                [
+                    self.get_surface_mask("ocean"),
+                    self.get_surface_mask("land"),
+                    self.get_surface_mask("sea_ice"),
+                ],
+                [ocean, land, sea_ice],
+                default="F",
+            ).astype("<U1", copy=False),
         )
@@ -202,28 +202,31 @@ class PamProfile:
                 longitude=slice(lon0, lon1), latitude=slice(lat1, lat0)
             )
 
-        # reverse pressure grid
-        ds = ds.sel(level=ds.level[::-1])
+        # reverse pressure grid (strided view, no copy)
+        ds = ds.isel(level=slice(None, None, -1))
 
         # reverse latitude grid
-        ds = ds.sel(latitude=ds.latitude[::-1])
+        ds = ds.isel(latitude=slice(None, None, -1))
 
         # pressure to pascal
         ds["level"] *= 100  # to Pa
 
-        # geopotential to height
+        # geopotential to height with heights below -200 m clipped; done in
+        # one pass into a single output buffer
         g = 9.80665  # Earth's gravitational acceleration
-        ds["hgt"] = ds["z"] / g
+        hgt = np.empty_like(ds["z"].values)
+        np.divide(ds["z"].values, g, out=hgt)
+        np.maximum(hgt, -200, out=hgt)
+        ds["hgt"] = (ds["z"].dims, hgt)
 
-        # set negative heights to -200 m
-        ds["hgt"] = ds["hgt"].where(ds["hgt"] > -200, -200)
-
-        # combine hydrometeor variables
+        # combine hydrometeor variables; stack the raw arrays and clamp
+        # negative contents in place instead of xr.concat plus where
         vars_hyd = ["clwc", "ciwc", "crwc", "cswc"]
         ds.coords["hyd"] = vars_hyd
-        ds["hydro_q"] = xr.concat([ds[h] for h in vars_hyd], dim="hyd")
-        ds["hydro_q"] = ds["hydro_q"].where(ds["hydro_q"] > 0, 0)
-        ds = ds.drop_vars(ds.hyd.values)  # drop individual variables
+        arr = np.stack([ds[h].values for h in vars_hyd], axis=0)
+        np.maximum(arr, 0, out=arr)
+        ds["hydro_q"] = (("hyd",) + ds[vars_hyd[0]].dims, arr)
+        ds = ds.drop_vars(vars_hyd)  # drop individual variables
 
         return cls(ds, **kwargs)
 
@@ -232,24 +235,25 @@ class PamProfile:
         Prepares relative humidity
         """
 
-        self.ds[rh_var] = self.ds[rh_var].where(
-            self.ds[rh_var] < 100, 100
-        )  # limit to 100 %
-        self.ds[rh_var] = self.ds[rh_var].where(
-            self.ds[rh_var] > 0, 0
-        )  # limit to 0 %
+        arr = self.ds[rh_var].data
+        if isinstance(arr, np.ndarray):
+            # limit to 0-100 % in a single in-place pass
+            np.clip(arr, 0, 100, out=arr)
+        else:
+            # dask-backed: write through the dataset, mutating a computed
+            # .values copy would be silently discarded
+            self.ds[rh_var] = self.ds[rh_var].clip(0, 100)
 
     def convert_time(self):
         """
         Prepares time
         """
 
-        # time to unix time
+        # time to unix time; datetime64[s] values are unix seconds, so a
+        # zero-copy view replaces the epoch subtraction
         self.ds["time"] = (
             self.ds["time"].dims,
-            (self.ds.time.values - np.datetime64("1970-01-01"))
-            .astype("timedelta64[s]")
-            .astype("int"),
+            self.ds.time.values.astype("datetime64[s]").view("int64"),
         )
 
     def expand_variables(self):
@@ -267,26 +271,23 @@ class PamProfile:
         if "hydro_q" not in self.ds:
             var_lst.remove("hydro_q")
 
-        # expand variables until they are a function of grid_x and grid_x
-        for v in var_lst:
-            # grid_y is missing
-            if "grid_x" in self.ds[v].dims and "grid_y" not in self.ds[v].dims:
-                self.ds[v] = self.ds[v].expand_dims({"grid_y": self.ds.grid_y})
-
-            # grid_x is missing
-            elif (
-                "grid_x" not in self.ds[v].dims and "grid_y" in self.ds[v].dims
-            ):
-                self.ds[v] = self.ds[v].expand_dims({"grid_x": self.ds.grid_x})
+        # broadcast variables against a (grid_x, grid_y) template until they
+        # are a function of both grid dimensions
+        template = xr.DataArray(
+            np.empty(
+                (self.ds.sizes["grid_x"], self.ds.sizes["grid_y"]),
+                dtype="int8",
+            ),
+            dims=("grid_x", "grid_y"),
+            coords={"grid_x": self.ds.grid_x, "grid_y": self.ds.grid_y},
+        )
 
-            # both dimensions are missing
-            elif (
+        for v in var_lst:
+            if (
                 "grid_x" not in self.ds[v].dims
-                and "grid_y" not in self.ds[v].dims
+                or "grid_y" not in self.ds[v].dims
             ):
-                self.ds[v] = self.ds[v].expand_dims(
-                    {"grid_x": self.ds.grid_x, "grid_y": self.ds.grid_y}
-                )
+                self.ds[v] = self.ds[v].broadcast_like(template)
 
     def add_obs_height(self):
         """
@@ -341,7 +342,14 @@ class PamProfile:
         Sets all hydrometeor variables to zero.
         """
 
-        self.ds["hydro_q"] = xr.zeros_like(self.ds["hydro_q"])
+        arr = self.ds["hydro_q"].data
+        if isinstance(arr, np.ndarray):
+            # zero the existing buffer in place instead of allocating a
+            # new array with xr.zeros_like
+            arr.fill(0)
+        else:
+            # dask-backed: filling a computed .values copy would be lost
+            self.ds["hydro_q"] = xr.zeros_like(self.ds["hydro_q"])
 
     def transform_ds(self):
         """
@@ -434,7 +442,8 @@ class PamProfile:
                 )
             )
 
-        pam_profile = dict()
-        for var in pam_vars:
-            pam_profile[var] = self.ds[var].values
+        # hand the underlying buffers to pamtra without forcing copies
+        pam_profile = {
+            var: np.asarray(self.ds[var].data) for var in pam_vars
+        }
         self.pam.createProfile(**pam_profile)
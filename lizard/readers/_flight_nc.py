@@ -0,0 +1,52 @@
+"""
+Shared helper for readers of per-flight netCDF files.
+
+Most of these readers do the same thing: split the flight id, format the
+flight date, build a path below PATH_SEC, and open the file. Keeping the
+boilerplate here leaves each reader as a one-liner and gives a single
+place to tune how the files are opened.
+"""
+
+import os
+
+import xarray as xr
+from dotenv import load_dotenv
+
+from lizard.readers._meta import get_meta
+
+load_dotenv()
+
+
+def read_flight_nc(flight_id, subdir, filename, chunks="auto"):
+    """
+    Opens a per-flight netCDF file below PATH_SEC.
+
+    Parameters
+    ----------
+    flight_id: research flight id from ac3airborne.
+    subdir: directory below PATH_SEC containing the files.
+    filename: file name template with {flight_id} and {date} fields.
+    chunks: chunking passed to xr.open_dataset. The default "auto" opens
+        the file lazily along the on-disk chunks, so downstream slicing
+        only reads the relevant blocks. Pass None to load eagerly.
+
+    Returns
+    -------
+    ds: xarray Dataset of the file content.
+    """
+
+    mission, platform, name = flight_id.split("_")
+    date = get_meta()[mission][platform][flight_id]["date"].strftime("%Y%m%d")
+
+    ds = xr.open_dataset(
+        os.path.join(
+            # resolved per call, so importing the readers works without
+            # the environment variable set
+            os.environ["PATH_SEC"],
+            subdir,
+            filename.format(flight_id=flight_id, date=date),
+        ),
+        chunks=chunks,
+    )
+
+    return ds
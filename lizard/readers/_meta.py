@@ -0,0 +1,29 @@
+"""
+Shared access to ac3airborne flight segments and intake catalog.
+
+The readers used to fetch both at import time, once per module. Fetching
+lazily through these memoized getters performs the network/disk access a
+single time per process, on first use.
+"""
+
+from functools import lru_cache
+
+import ac3airborne
+
+
+@lru_cache(maxsize=1)
+def get_meta():
+    """
+    Returns the ac3airborne flight segments (fetched once per process).
+    """
+
+    return ac3airborne.get_flight_segments()
+
+
+@lru_cache(maxsize=1)
+def get_catalog():
+    """
+    Returns the ac3airborne intake catalog (fetched once per process).
+    """
+
+    return ac3airborne.get_intake_catalog()
@@ -3,36 +3,63 @@ Read AMALi data from local intake catalog
 """
 
 import os
+from functools import lru_cache
 
-import ac3airborne
 import intake
 
-META = ac3airborne.get_flight_segments()
-CAT = intake.open_catalog(
-    os.path.join(os.environ["PATH_DAT"], "obs/campaigns/intake/catalog.yaml")
-)
-os.environ["LOCAL_DATA"] = "/data/obs/campaigns/"
-PATH_CACHE_INTAKE = dict(
-    storage_options={
-        "simplecache": dict(
-            cache_storage=os.environ["PATH_CACHE_INTAKE"],
-            same_names=True,
+from lizard.readers._meta import get_meta
+
+_CAT = None
+
+
+def _get_cat():
+    """
+    Opens the local intake catalog on first use instead of at import.
+    """
+
+    global _CAT
+
+    if _CAT is None:
+        _CAT = intake.open_catalog(
+            os.path.join(
+                os.environ["PATH_DAT"], "obs/campaigns/intake/catalog.yaml"
+            )
         )
-    }
-)
+        os.environ["LOCAL_DATA"] = "/data/obs/campaigns/"
+
+    return _CAT
+
 
+def _path_cache_intake():
+    return dict(
+        storage_options={
+            "simplecache": dict(
+                cache_storage=os.environ["PATH_CACHE_INTAKE"],
+                same_names=True,
+            )
+        }
+    )
 
+
+@lru_cache(maxsize=32)
 def read_amali(flight_id):
     """
     Reads AMALi L0 data from local intake catalog
+
+    The result is cached per flight_id; callers should not mutate the
+    returned dataset.
     """
 
     mission, platform, name = flight_id.split("_")
-    flight = META[mission][platform][flight_id]
+    flight = get_meta()[mission][platform][flight_id]
 
-    ds = CAT[mission][platform]["AMALi"][flight_id](**PATH_CACHE_INTAKE).read()
+    # open lazily and slice to the flight before loading, so only the
+    # takeoff-to-landing part of the file is materialized
+    ds = _get_cat()[mission][platform]["AMALi"][flight_id](
+        **_path_cache_intake()
+    ).to_dask()
 
-    ds = ds.sel(time=slice(flight["takeoff"], flight["landing"]))
+    ds = ds.sel(time=slice(flight["takeoff"], flight["landing"])).load()
 
     ds = ds.rename({"height": "range"})
 
@@ -4,15 +4,37 @@ Reader for AMSR2 sea ice concentration hdf files
 
 
 import os
+from functools import lru_cache
 
 import pandas as pd
 import xarray as xr
 from osgeo import gdal
 
+# skip directory scans when opening files and allow a larger block cache
+gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "TRUE")
+gdal.SetConfigOption("GDAL_CACHEMAX", "1000")
 
-def read_amsr2_sic(date, path):
+
+@lru_cache(maxsize=4)
+def _load_grid(path):
+    """
+    Reads the fixed Arctic lon/lat grid once per path. The grid file is
+    identical for every date, so repeated calls reuse the cached arrays.
+    """
+
+    grid_file = os.path.join(path, "LongitudeLatitudeGrid-n6250-Arctic.hdf")
+
+    lon = gdal.Open('HDF4_SDS:UNKNOWN:"' + grid_file + '":0').ReadAsArray()
+    lat = gdal.Open('HDF4_SDS:UNKNOWN:"' + grid_file + '":1').ReadAsArray()
+
+    return lon, lat
+
+
+def read_amsr2_sic_raw(date, path):
     """
     Read hdf files of sea ice concentration from University of Bremen
+    as plain numpy arrays, without the xarray wrapper. Useful for
+    gridding code that only needs the raw values.
 
     Input
     -------
@@ -20,20 +42,10 @@ def read_amsr2_sic(date, path):
 
     Returns
     -------
-    xarray.Dataset with sea ice concentration
+    (lon, lat, sic) numpy arrays
     """
 
-    lon = gdal.Open(
-        'HDF4_SDS:UNKNOWN:"'
-        + os.path.join(path, "LongitudeLatitudeGrid-n6250-Arctic.hdf")
-        + '":0'
-    ).ReadAsArray()
-
-    lat = gdal.Open(
-        'HDF4_SDS:UNKNOWN:"'
-        + os.path.join(path, "LongitudeLatitudeGrid-n6250-Arctic.hdf")
-        + '":1'
-    ).ReadAsArray()
+    lon, lat = _load_grid(path)
 
     sic = gdal.Open(
         os.path.join(
@@ -44,13 +56,28 @@ def read_amsr2_sic(date, path):
         )
     ).ReadAsArray()
 
+    return lon, lat, sic
+
+
+def read_amsr2_sic(date, path):
+    """
+    Read hdf files of sea ice concentration from University of Bremen
+
+    Input
+    -------
+    date:  date (yyyymmdd) for which sea ice should be retrieved
+
+    Returns
+    -------
+    xarray.Dataset with sea ice concentration
+    """
+
+    lon, lat, sic = read_amsr2_sic_raw(date, path)
+
     # combineas xarray dataset
     ds = xr.Dataset()
     ds.coords["lon"] = (("x", "y"), lon)
     ds.coords["lat"] = (("x", "y"), lat)
     ds["sic"] = (("x", "y"), sic)
 
-    # close dataset
-    del sic
-
     return ds
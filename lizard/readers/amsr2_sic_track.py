@@ -3,16 +3,17 @@ Reads AMSR2 sea ice concentration along flight track
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-import ac3airborne
+import numpy as np
 import xarray as xr
 from dotenv import load_dotenv
 
 from lizard.ac3airlib import get_all_flights
+from lizard.readers._meta import get_catalog
 
 load_dotenv()
 
-CAT = ac3airborne.get_intake_catalog()
 PATH_CACHE_INTAKE = dict(
     storage_options={
         "simplecache": dict(
@@ -34,7 +35,7 @@ def read_amsr2_sic_track(flight_id):
 
     mission, platform, name = flight_id.split("_")
 
-    ds = CAT[mission][platform]["AMSR2_SIC"][flight_id](**PATH_CACHE_INTAKE).read()
+    ds = get_catalog()[mission][platform]["AMSR2_SIC"][flight_id](**PATH_CACHE_INTAKE).read()
 
     return ds
 
@@ -53,15 +54,32 @@ def read_amsr2_sic_track_all():
     flight_ids = get_all_flights("HALO-AC3", "HALO")
     flight_ids.remove("HALO-AC3_HALO_RF00")
 
-    lst_ds = []
-    for flight_id in flight_ids:
-        ds = read_amsr2_sic_track(flight_id)
-        ds = ds.chunk({"time": 10000})
-        lst_ds.append(ds)
-
-    ds = xr.concat(lst_ds, dim="time")
-
-    # convert longitude format
-    ds["lon"].loc[{"time": ds["lon"] > 180}] -= 360
+    # the per-flight reads are independent I/O against the catalog, so
+    # fetch them concurrently
+    with ThreadPoolExecutor(
+        max_workers=min(len(flight_ids), 8)
+    ) as pool:
+        lst_ds = list(pool.map(read_amsr2_sic_track, flight_ids))
+
+    # the per-flight datasets share the same structure, so concatenate
+    # the raw arrays per variable instead of going through xr.concat,
+    # which aligns coordinates for every dataset pair
+    time = np.concatenate([ds.time.values for ds in lst_ds])
+    lon = np.concatenate([ds.lon.values for ds in lst_ds])
+    lat = np.concatenate([ds.lat.values for ds in lst_ds])
+    sic = np.concatenate([ds.sic.values for ds in lst_ds])
+
+    # convert longitude format in place; the concatenated array is
+    # private, so no copy is needed
+    np.subtract(lon, 360, out=lon, where=lon > 180)
+
+    ds = xr.Dataset(
+        {"sic": ("time", sic)},
+        coords={
+            "time": time,
+            "lon": ("time", lon),
+            "lat": ("time", lat),
+        },
+    )
 
     return ds
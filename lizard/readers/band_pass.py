@@ -35,6 +35,7 @@ Key for MW pass band filter files:
 
 
 import os
+from functools import lru_cache
 
 import numpy as np
 import xarray as xr
@@ -42,6 +43,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+PATH_SEC = os.environ["PATH_SEC"]
+
 
 ACRONYM = {
     "AltiKa": "altika",
@@ -129,6 +132,9 @@ def read_band_pass(
     some instruments differs between satellites (i.e., SSMIS, MWRI, ESMR).
     For these, the satellite should be given as well.
 
+    The parsed datasets are cached, so repeated calls for the same
+    instrument do not re-read the filter file.
+
     Example:
     read_band_pass('SSMIS', 'DMSP-F18')
 
@@ -144,6 +150,18 @@ def read_band_pass(
     xarray.Dataset of the instrument band pass data.
     """
 
+    # copy, so callers can modify the result without touching the cache
+    return _read_band_pass(
+        instrument, satellite, calc_avg, add_labels, path
+    ).copy(deep=True)
+
+
+@lru_cache(maxsize=32)
+def _read_band_pass(instrument, satellite, calc_avg, add_labels, path):
+    """
+    Parses the filter file once per argument combination.
+    """
+
     # get rttov acronym
     acronym = ACRONYM[instrument]
     if type(acronym) == dict:
@@ -152,70 +170,36 @@ def read_band_pass(
     # read file
     if path is None:
         file = os.path.join(
-            os.environ["PATH_SEC"],
+            PATH_SEC,
             f"data/sat/mw_overview/filter_files/{acronym}.flt",
         )
     
     else:
         file = os.path.join(
-            os.environ["PATH_SEC"],
+            PATH_SEC,
             path,
             f"{acronym}.flt",
         )
 
-    pass_band = {}
-    empty_channel = dict(
-        polarization="",
-        n_if_offsets="",
-        bandwidth="",
-        center_freq="",
-        if_offset_1="",
-        if_offset_2="",
-    )
-
     with open(file, "r") as f:
-        i = 0
-        for line in f.readlines():
-            if line == "\n":
-                continue
-
-            elif i % 2 == 0:
-                line_elements = line.split()
-
-                ch = int(line_elements[0])
-
-                # create empty channel
-                pass_band[ch] = empty_channel.copy()
-                pass_band[ch]["polarization"] = int(line_elements[1])
-                pass_band[ch]["n_if_offsets"] = int(line_elements[2])
-                pass_band[ch]["bandwidth"] = float(line_elements[3])
-
-                i += 1
-
-            else:
-                line_elements = line.split()
-
-                pass_band[ch]["center_freq"] = float(line_elements[0])
-
-                if len(line_elements) > 1:
-                    pass_band[ch]["if_offset_1"] = float(line_elements[1])
-
-                else:
-                    pass_band[ch]["if_offset_1"] = 0
-
-                if len(line_elements) > 2:
-                    pass_band[ch]["if_offset_2"] = float(line_elements[2])
-
-                else:
-                    pass_band[ch]["if_offset_2"] = 0
-
-                i += 1
+        rows = [line.split() for line in f if line.strip()]
+
+    # records alternate between channel header and frequency lines; split
+    # into the two blocks and convert each column in bulk instead of
+    # building a dict per channel
+    hdr = np.array(rows[0::2])
+    freq = np.array(
+        [row + ["0"] * (3 - len(row)) for row in rows[1::2]], dtype=float
+    )
 
-    # change data types from string to int/float
     ds = xr.Dataset()
-    ds.coords["channel"] = list(pass_band.keys())
-    for x in empty_channel.keys():
-        ds[x] = ("channel", [pass_band[ch][x] for ch in ds.channel.values])
+    ds.coords["channel"] = hdr[:, 0].astype(int)
+    ds["polarization"] = ("channel", hdr[:, 1].astype(int))
+    ds["n_if_offsets"] = ("channel", hdr[:, 2].astype(int))
+    ds["bandwidth"] = ("channel", hdr[:, 3].astype(float))
+    ds["center_freq"] = ("channel", freq[:, 0])
+    ds["if_offset_1"] = ("channel", freq[:, 1])
+    ds["if_offset_2"] = ("channel", freq[:, 2])
 
     # add attributes
     ds.attrs = dict(
@@ -320,16 +304,18 @@ def calc_avg_freq(ds):
     """
 
     ds.coords["n_avg_freq"] = [1, 2, 3, 4]
+
+    # compute all four sideband combinations in one broadcasted pass
+    # instead of four xarray column assignments
+    c = ds.center_freq.values[:, np.newaxis]
+    o1 = ds.if_offset_1.values[:, np.newaxis]
+    o2 = ds.if_offset_2.values[:, np.newaxis]
+    signs = np.array([[-1, -1], [-1, 1], [1, -1], [1, 1]])
     ds["avg_freq"] = (
         ("channel", "n_avg_freq"),
-        np.zeros((len(ds.channel), 4)),
+        c + signs[:, 0] * o1 + signs[:, 1] * o2,
     )
 
-    ds["avg_freq"][:, 0] = ds.center_freq - ds.if_offset_1 - ds.if_offset_2
-    ds["avg_freq"][:, 1] = ds.center_freq - ds.if_offset_1 + ds.if_offset_2
-    ds["avg_freq"][:, 2] = ds.center_freq + ds.if_offset_1 - ds.if_offset_2
-    ds["avg_freq"][:, 3] = ds.center_freq + ds.if_offset_1 + ds.if_offset_2
-
     ds.coords["n_avg_freq"].attrs = dict(
         description="Enumerating the frequencies, which are averaged."
     )
@@ -354,14 +340,23 @@ def create_labels(ds):
     labels: list of labels
     """
 
+    # pull the columns out once instead of five label-based lookups per
+    # channel
+    channels = ds.channel.values
+    n_arr = ds.n_if_offsets.values
+    c_arr = ds.center_freq.values
+    o1_arr = ds.if_offset_1.values
+    o2_arr = ds.if_offset_2.values
+    p_arr = ds.polarization.values
+
     labels = []
     labels_pol = []
-    for channel in ds.channel:
-        n = ds.n_if_offsets.sel(channel=channel).item()
-        c = ds.center_freq.sel(channel=channel).item()
-        o1 = ds.if_offset_1.sel(channel=channel).item()
-        o2 = ds.if_offset_2.sel(channel=channel).item()
-        p = POL_MEANING[ds.polarization.sel(channel=channel).item()]
+    for i, channel in enumerate(channels):
+        n = n_arr[i]
+        c = c_arr[i]
+        o1 = o1_arr[i]
+        o2 = o2_arr[i]
+        p = POL_MEANING[p_arr[i]]
 
         if n == 0:
             label = r"%g GHz" % c
@@ -4,13 +4,12 @@ Read broadband radiance and KT-19 from intake catalog
 
 import os
 
-import ac3airborne
 from dotenv import load_dotenv
 
+from lizard.readers._meta import get_catalog, get_meta
+
 load_dotenv()
 
-META = ac3airborne.get_flight_segments()
-CAT = ac3airborne.get_intake_catalog()
 PATH_CACHE_INTAKE = dict(
     storage_options={
         "simplecache": dict(
@@ -31,14 +30,11 @@ def read_bbr(
 
     mission, platform, name = flight_id.split("_")
 
-    if mission == "HALO-AC3":
-        ds = CAT[mission][platform]["BROADBAND_IRRADIANCE"][flight_id](
-            **PATH_CACHE_INTAKE, **CRED
-        ).read()
-    else:
-        ds = CAT[mission][platform]["BROADBAND_IRRADIANCE"][flight_id](
-            **PATH_CACHE_INTAKE
-        ).read()
+    # credentials are only needed for HALO-AC3; one call path for both
+    kwargs = {**PATH_CACHE_INTAKE, **(CRED if mission == "HALO-AC3" else {})}
+    ds = get_catalog()[mission][platform]["BROADBAND_IRRADIANCE"][flight_id](
+        **kwargs
+    ).read()
 
     if "Time" in list(ds.dims):
         ds["Time"] = ds.time
@@ -46,29 +42,16 @@ def read_bbr(
         ds = ds.rename({"Time": "time"})
 
     if reduce_to_flight:
-        ds = ds.sel(
-            time=slice(
-                META[mission][platform][flight_id]["takeoff"],
-                META[mission][platform][flight_id]["landing"],
-            )
-        )
+        flight = get_meta()[mission][platform][flight_id]
+        ds = ds.sel(time=slice(flight["takeoff"], flight["landing"]))
 
     if attitude_flag:
         ds = ds.sel(time=ds.Attitude_Flag == 0)
 
-    # resample to 1 s resolution
+    # resample to 1 s resolution; xarray's resample keeps the attributes,
+    # so no need to round-trip through pandas and restore them by hand
     if resample:
-        glob_attrs = ds.attrs
-        var_attrs = {x: ds[x].attrs for x in list(ds)}
-        coord_attrs = {x: ds[x].attrs for x in list(ds.coords)}
-        ds = ds.to_pandas().resample("1S").mean().to_xarray()
-        ds.attrs = glob_attrs
-
-        for x, a in var_attrs.items():
-            ds[x].attrs = a
-
-        for x, a in coord_attrs.items():
-            ds[x].attrs = a
+        ds = ds.resample(time="1S").mean(keep_attrs=True)
 
     # KT-19 TB is in C for HALO-AC3 and in K for all other missions
     if mission == "HALO-AC3":
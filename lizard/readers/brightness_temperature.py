@@ -2,14 +2,11 @@
 Read file with brightness temperatures and footprint positions.
 """
 
-import os
-import xarray as xr
-import ac3airborne
 from dotenv import load_dotenv
 
-load_dotenv()
+from lizard.readers._flight_nc import read_flight_nc
 
-META = ac3airborne.get_flight_segments()
+load_dotenv()
 
 
 def read_tb(flight_id):
@@ -21,13 +18,8 @@ def read_tb(flight_id):
     flight_id: research flight id from ac3airborne.
     """
 
-    mission, platform, name = flight_id.split('_')
-    date = META[mission][platform][flight_id]['date'].strftime('%Y%m%d')
-
-    ds = xr.open_dataset(os.path.join(
-        os.environ['PATH_SEC'],
-        "data/sea_ice_emissivity/"
-        'brightness_temperature',
-        f'tb_{flight_id}_{date}.nc'))
-
-    return ds
+    return read_flight_nc(
+        flight_id,
+        "data/sea_ice_emissivity/brightness_temperature",
+        "tb_{flight_id}_{date}.nc",
+    )
@@ -4,9 +4,9 @@ Read cloud top height from intake catalog
 
 import os
 
-import ac3airborne
+from lizard.readers._meta import get_catalog
+
 
-CAT = ac3airborne.get_intake_catalog()
 PATH_CACHE_INTAKE = dict(
     storage_options={
         "simplecache": dict(
@@ -24,7 +24,7 @@ def read_cloud_top_height(flight_id):
 
     mission, platform, name = flight_id.split("_")
 
-    ds = CAT[mission][platform]["CLOUD_TOP_HEIGHT"][flight_id](
+    ds = get_catalog()[mission][platform]["CLOUD_TOP_HEIGHT"][flight_id](
         **PATH_CACHE_INTAKE
     ).read()
 
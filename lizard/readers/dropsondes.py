@@ -4,9 +4,10 @@ Read all dropsondes of research flight
 
 import os
 
-import ac3airborne
 import numpy as np
 
+from lizard.readers._meta import get_catalog, get_meta
+
 ac3cloud_username = os.environ["AC3_USER"]
 ac3cloud_password = os.environ["AC3_PASSWORD"]
 
@@ -19,8 +20,6 @@ kwds = {
     )
 }
 
-cat = ac3airborne.get_intake_catalog()
-meta = ac3airborne.get_flight_segments()
 
 
 def read_dropsonde(flight_id):
@@ -29,12 +28,21 @@ def read_dropsonde(flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    cat_ds = cat[mission][platform]["DROPSONDES"][flight_id]
+    cat_ds = get_catalog()[mission][platform]["DROPSONDES"][flight_id]
 
     dict_dsd = {}
     if mission in ["ACLOUD", "AFLUX", "MOSAiC-ACA"]:
+        # get the number of sondes from the catalog metadata where
+        # available, so only valid indices are requested instead of
+        # probing 1..99 and waiting for the first failed fetch
+        n_sondes = None
+        for par in cat_ds.describe().get("user_parameters", []):
+            if par.get("name") == "i_sonde" and par.get("max") is not None:
+                n_sondes = int(par["max"])
+                break
+
         try:
-            for i in range(1, 100):
+            for i in range(1, (n_sondes or 99) + 1):
                 dict_dsd[f"{flight_id}_{str(i).zfill(2)}"] = cat_ds(
                     i_sonde=i, storage_options=kwds
                 ).read()
@@ -57,7 +65,7 @@ def read_dropsonde(flight_id):
             # convert time from decimal hours to actual date format
             dict_dsd[k]["Time"] = dict_dsd[k].Time.astype(
                 "timedelta64[h]"
-            ) + np.datetime64(meta[mission][platform][flight_id]["date"])
+            ) + np.datetime64(get_meta()[mission][platform][flight_id]["date"])
 
             # set time as index and remove z (which just counts from 0 to number of values)
             dict_dsd[k] = dict_dsd[k].assign_coords(z=dict_dsd[k].Time.values)
@@ -78,11 +86,12 @@ def add_launch_time(ds, flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    flight = meta[mission][platform][flight_id]
+    flight = get_meta()[mission][platform][flight_id]
 
-    ts = ds.attrs["Launch_Time_UTC"].split(":")
-    ms = ["h", "m", "s"]
-    x = np.array([np.timedelta64(int(t), m) for t, m in zip(ts, ms)]).sum()
+    # build the offset as one timedelta in seconds instead of summing
+    # three separately constructed timedeltas
+    h, m, s = map(int, ds.attrs["Launch_Time_UTC"].split(":"))
+    x = np.timedelta64(h * 3600 + m * 60 + s, "s")
     ds["launch_time"] = np.datetime64(flight["date"]) + x
 
     return ds
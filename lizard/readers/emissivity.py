@@ -4,13 +4,13 @@ Read file with emissivity and additionally data.
 
 import os
 
-import ac3airborne
 import xarray as xr
 from dotenv import load_dotenv
 
+from lizard.readers._meta import get_meta
+
 load_dotenv()
 
-META = ac3airborne.get_flight_segments()
 
 
 def read_emissivity_aircraft(flight_id, without_offsets=True):
@@ -29,7 +29,7 @@ def read_emissivity_aircraft(flight_id, without_offsets=True):
     """
 
     mission, platform, name = flight_id.split("_")
-    date = META[mission][platform][flight_id]["date"].strftime("%Y%m%d")
+    date = get_meta()[mission][platform][flight_id]["date"].strftime("%Y%m%d")
 
     ds = xr.open_dataset(
         os.path.join(
@@ -61,7 +61,7 @@ def read_emissivity_satellite(flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    date = META[mission][platform][flight_id]["date"].strftime("%Y%m%d")
+    date = get_meta()[mission][platform][flight_id]["date"].strftime("%Y%m%d")
 
     ds = xr.open_dataset(
         os.path.join(
@@ -10,8 +10,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+PATH_SEC = os.environ["PATH_SEC"]
 
-def read_era5_single_levels(time, roi=None):
+
+def read_era5_single_levels(time, roi=None, chunks="auto"):
     """
     Reads ERA-5 single levels data for a given time step.
 
@@ -19,6 +21,9 @@ def read_era5_single_levels(time, roi=None):
     ----------
     time: day for which ERA-5 data is imported.
     roi: region of interest
+    chunks: chunking passed to xr.open_dataset. With the default "auto"
+        the file is opened lazily, so a region of interest only reads
+        the covering chunks. Pass None to load eagerly.
 
     Returns
     -------
@@ -27,11 +32,12 @@ def read_era5_single_levels(time, roi=None):
 
     ds = xr.open_dataset(
         os.path.join(
-            os.environ["PATH_SEC"],
+            PATH_SEC,
             "data/era5/",
             pd.Timestamp(time).strftime("%Y/%m"),
             f'era5-single-levels_60n_{pd.Timestamp(time).strftime("%Y%m%d")}.nc',
-        )
+        ),
+        chunks=chunks,
     )
 
     if roi is not None:
@@ -42,7 +48,7 @@ def read_era5_single_levels(time, roi=None):
     return ds
 
 
-def read_era5_pressure_levels(time, roi=None):
+def read_era5_pressure_levels(time, roi=None, chunks="auto"):
     """
     Reads ERA-5 pressure levels data for a given time step.
 
@@ -50,6 +56,9 @@ def read_era5_pressure_levels(time, roi=None):
     ----------
     time: day for which ERA-5 data is imported.
     roi: region of interest
+    chunks: chunking passed to xr.open_dataset. With the default "auto"
+        the file is opened lazily, so a region of interest only reads
+        the covering chunks. Pass None to load eagerly.
 
     Returns
     -------
@@ -58,11 +67,12 @@ def read_era5_pressure_levels(time, roi=None):
 
     ds = xr.open_dataset(
         os.path.join(
-            os.environ["PATH_SEC"],
+            PATH_SEC,
             "data/era5/",
             pd.Timestamp(time).strftime("%Y/%m"),
             f'era5-pressure-levels_60n_{pd.Timestamp(time).strftime("%Y%m%d")}.nc',
-        )
+        ),
+        chunks=chunks,
     )
 
     if roi is not None:
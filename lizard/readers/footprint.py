@@ -6,12 +6,7 @@ The data was calculated within the sea ice emissivity project based on the GPS
 data and a digital terrain model.
 """
 
-import os
-
-import ac3airborne
-import xarray as xr
-
-META = ac3airborne.get_flight_segments()
+from lizard.readers._flight_nc import read_flight_nc
 
 
 def read_footprint(flight_id):
@@ -27,15 +22,8 @@ def read_footprint(flight_id):
     ds: footprint dataset
     """
 
-    mission, platform, name = flight_id.split("_")
-    date = META[mission][platform][flight_id]["date"].strftime("%Y%m%d")
-
-    ds = xr.open_dataset(
-        os.path.join(
-            os.environ["PATH_SEC"],
-            "data/sea_ice_emissivity/footprint",
-            f"footprint_{flight_id}_{date}.nc",
-        )
+    return read_flight_nc(
+        flight_id,
+        "data/sea_ice_emissivity/footprint",
+        "footprint_{flight_id}_{date}.nc",
     )
-
-    return ds
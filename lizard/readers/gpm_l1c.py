@@ -71,7 +71,9 @@ AMSR2 (p33, ATBD1.9):
 """
 
 import os
-from glob import glob
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import h5py
 import numpy as np
@@ -80,6 +82,13 @@ import xarray as xr
 from dotenv import load_dotenv
 from pyproj import Transformer
 
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 load_dotenv()
 
 
@@ -132,6 +141,66 @@ CHANNELS_SORTED = {
     "AMSR2": np.array([13, 14]),
 }
 
+
+@lru_cache(maxsize=None)
+def _granule_index(instrument, satellite):
+    """
+    Indexes the granule files of an instrument/satellite pair with one
+    directory scan, so batch reads look up paths in O(1) instead of
+    globbing the directory per granule.
+    """
+
+    prefix = f"1C.{FILENAME_SAT[(instrument, satellite)]}.XCAL"
+    directory = os.path.join(os.environ["PATH_SAT"], "gpm_l1c")
+
+    return {
+        entry.name.split(".")[-3]: entry.path
+        for entry in os.scandir(directory)
+        if entry.name.startswith(prefix) and entry.name.endswith(".HDF5")
+    }
+
+
+@lru_cache(maxsize=None)
+def _file_times(instrument, satellite):
+    """
+    Parses orbit start and end times from the cached granule file names
+    once per instrument/satellite pair.
+
+    Returns
+    -------
+    files, start_time, end_time arrays sorted by file name.
+    """
+
+    files = np.asarray(sorted(_granule_index(instrument, satellite).values()))
+
+    # slice date, start and end time out of each file name in a single
+    # pass over the listing
+    parts = [(s[-41:-33], s[-31:-25], s[-23:-17]) for s in files]
+
+    start_time = pd.to_datetime(
+        [d + t0 for d, t0, t1 in parts], format="%Y%m%d%H%M%S"
+    ).values
+    end_time = pd.to_datetime(
+        [d + t1 for d, t0, t1 in parts], format="%Y%m%d%H%M%S"
+    ).values
+
+    # correction of end time by one day if needed
+    next_day = (end_time - start_time) < np.timedelta64(0, "s")
+    end_time[next_day] += np.timedelta64(1, "D")
+
+    return files, start_time, end_time
+
+
+# a larger chunk cache keeps recently touched scan chunks hot when
+# slicing granules along track
+_H5_CACHE_KWDS = dict(
+    rdcc_nbytes=64 * 1024 * 1024, rdcc_nslots=1048583, rdcc_w0=0.75
+)
+
+# building a Transformer parses the CRS definitions, which costs far
+# more than the transform itself; create it once and reuse it
+_TRANSFORMER_4326_3413 = Transformer.from_crs("EPSG:4326", "EPSG:3413")
+
 # only W-/G-band swaths with the first-mentioned containing W-band
 SWATHS = {
     "MHS": np.array(["S1"]),
@@ -140,6 +209,13 @@ SWATHS = {
     "AMSR2": np.array(["S5", "S6"]),
 }
 
+# freeze the lookup tables, which are shared module state that the
+# cached file index and time stamps depend on
+FILENAME_SAT = types.MappingProxyType(FILENAME_SAT)
+SWATH_CHANNELS = types.MappingProxyType(SWATH_CHANNELS)
+CHANNELS_SORTED = types.MappingProxyType(CHANNELS_SORTED)
+SWATHS = types.MappingProxyType(SWATHS)
+
 
 def read_gpm_l1c(
     instrument,
@@ -204,24 +280,26 @@ def read_gpm_l1c(
         add_index=add_index,
     )
 
+    swaths = SWATHS[instrument]
+
     ds = None
     if instrument == "MHS":
-        ds = read_gpm_l1c_swath(swath=SWATHS[instrument][0], **kwds)
+        ds = read_gpm_l1c_swath(swath=swaths[0], **kwds)
 
     elif instrument in ["ATMS", "SSMIS"]:
-        ds1 = read_gpm_l1c_swath(
-            sg=SWATHS[instrument][0], st=SWATHS[instrument][0], **kwds
-        )
+        ds1 = read_gpm_l1c_swath(sg=swaths[0], st=swaths[0], **kwds)
 
-        # merge tbs from second swath
+        # merge tbs from second swath; both swaths share the geographic
+        # variables, so only tb is read again and concatenated along
+        # channel instead of merging full datasets with combine_first
         ds2 = read_gpm_l1c_swath(
-            sg=SWATHS[instrument][0], st=SWATHS[instrument][1], **kwds
+            sg=swaths[0], st=swaths[1], tb_only=True, **kwds
         )
-        ds = ds1.combine_first(ds2)
+        ds = ds1.assign(tb=xr.concat([ds1.tb, ds2.tb], dim="channel"))
 
     elif instrument == "AMSR2":
-        ds1 = read_gpm_l1c_swath(swath=SWATHS[instrument][0], **kwds)
-        ds2 = read_gpm_l1c_swath(swath=SWATHS[instrument][1], **kwds)
+        ds1 = read_gpm_l1c_swath(swath=swaths[0], **kwds)
+        ds2 = read_gpm_l1c_swath(swath=swaths[1], **kwds)
 
         # merge multiplying B-scans with -1
         ds2["x"] = -ds2["x"]
@@ -230,8 +308,13 @@ def read_gpm_l1c(
         # concatenate along track
         ds = xr.concat([ds1, ds2], dim="x")
 
-    # sort channels
-    ds = ds.sel(channel=CHANNELS_SORTED[instrument])
+    # sort channels by integer position instead of label-based .sel
+    chan = ds.channel.values
+    order = np.argsort(chan)
+    pos = order[
+        np.searchsorted(chan, CHANNELS_SORTED[instrument], sorter=order)
+    ]
+    ds = ds.isel(channel=pos)
 
     return ds
 
@@ -308,6 +391,7 @@ def read_gpm_l1c_swath(
     add_index=True,
     sg=None,
     st=None,
+    tb_only=False,
 ):
     """
     Reads specific swath of GPS L1C TB. There is an option to read the tb of
@@ -341,6 +425,9 @@ def read_gpm_l1c_swath(
     add_index: adds index for unique footprints within granule
     sg: swath for geographic location
     st: swath for tb
+    tb_only: read only the brightness temperatures of st (plus the
+      coordinates needed for the spatial filter); used when the other
+      variables were already read from a sibling swath
 
     Returns
     -------
@@ -353,49 +440,64 @@ def read_gpm_l1c_swath(
         st = swath
 
     granule = str(granule).zfill(6)  # allows for integer granule numbers
-    file = glob(
-        os.path.join(
-            os.environ["PATH_SAT"],
-            "gpm_l1c",
-            f"1C.{FILENAME_SAT[(instrument, satellite)]}.XCAL*.{granule}.V07A.HDF5",
-        )
-    )[0]
+    file = _granule_index(instrument, satellite)[granule]
 
-    with h5py.File(file, "r") as f:
+    with h5py.File(file, "r", **_H5_CACHE_KWDS) as f:
         # to store as xarray dataset
         data = dict()
 
-        dims_swath = f[sg]["Latitude"][:].shape
+        # read lat/lon once and reuse them for the filter and the output
+        lat = f[sg]["Latitude"][:]
+        lon = f[sg]["Longitude"][:]
+        dims_swath = lat.shape
 
         # reduce to region of interest
         if isinstance(roi, list):
-            ix = roi_index(
-                lat=f[sg]["Latitude"][:], lon=f[sg]["Longitude"][:], roi=roi
-            )
+            ix = roi_index(lat=lat, lon=lon, roi=roi)
         else:
             ix = distance_index(
-                lat=f[sg]["Latitude"][:],
-                lon=f[sg]["Longitude"][:],
+                lat=lat,
+                lon=lon,
                 center_lat=center_lat,
                 center_lon=center_lon,
                 max_distance=max_distance,
             )
 
-        # get scan time
-        time = extract_time(swath_data=f[sg])
-        data["scan_time"] = ("x", time[ix])
-        data["sc_orientation"] = ("x", f[sg]["SCstatus"]["SCorientation"][ix])
-        data["sc_lat"] = ("x", f[sg]["SCstatus"]["SClatitude"][ix])
-        data["sc_lon"] = ("x", f[sg]["SCstatus"]["SClongitude"][ix])
-        data["sc_alt"] = ("x", f[sg]["SCstatus"]["SCaltitude"][ix])
-        data["lat"] = (("x", "y"), f[sg]["Latitude"][ix])
-        data["lon"] = (("x", "y"), f[sg]["Longitude"][ix])
-        data["incidence_angle"] = (
-            ("x", "y"),
-            f[sg]["incidenceAngle"][ix, :, 0],
-        )
-        data["quality"] = (("x", "y"), f[sg]["Quality"][ix])
-        data["tb"] = (("x", "y", "channel"), f[st]["Tc"][ix, :, :])
+        # read only the contiguous scan range covering the selection as
+        # one hyperslab and mask in memory; boolean/fancy indexing on
+        # the h5py datasets turns into many small per-scan reads
+        hits = np.flatnonzero(ix)
+        i0, i1 = (hits[0], hits[-1] + 1) if hits.size else (0, 0)
+        ix_range = ix[i0:i1]
+
+        def read_scans(dset):
+            out = np.empty((i1 - i0,) + dset.shape[1:], dtype=dset.dtype)
+            if i1 > i0:
+                dset.read_direct(out, source_sel=np.s_[i0:i1])
+            return out[ix_range]
+
+        if not tb_only:
+            # get scan time
+            time = extract_time(swath_data=f[sg])
+            data["scan_time"] = ("x", time[ix])
+            data["sc_orientation"] = (
+                "x",
+                read_scans(f[sg]["SCstatus"]["SCorientation"]),
+            )
+            data["sc_lat"] = ("x", read_scans(f[sg]["SCstatus"]["SClatitude"]))
+            data["sc_lon"] = ("x", read_scans(f[sg]["SCstatus"]["SClongitude"]))
+            data["sc_alt"] = ("x", read_scans(f[sg]["SCstatus"]["SCaltitude"]))
+            data["lat"] = (("x", "y"), lat[ix])
+            data["lon"] = (("x", "y"), lon[ix])
+            # only the first angle entry is needed; select it in the
+            # source so the trailing axis never gets materialized
+            ang_ds = f[sg]["incidenceAngle"]
+            ang = np.empty((i1 - i0, ang_ds.shape[1]), dtype=ang_ds.dtype)
+            if i1 > i0:
+                ang_ds.read_direct(ang, source_sel=np.s_[i0:i1, :, 0])
+            data["incidence_angle"] = (("x", "y"), ang[ix_range])
+            data["quality"] = (("x", "y"), read_scans(f[sg]["Quality"]))
+        data["tb"] = (("x", "y", "channel"), read_scans(f[st]["Tc"]))
 
         ds = xr.Dataset(data)
 
@@ -406,14 +508,14 @@ def read_gpm_l1c_swath(
         ds.coords["y"] = y_ix
         ds.coords["channel"] = SWATH_CHANNELS[instrument][st]
 
-        # add unique footprint index
-        if add_index:
-            ds = ds.stack({"xy": ("x", "y")})
+        # add unique footprint index; x * n_y + y matches
+        # ravel_multi_index without the stack/unstack round-trip
+        if add_index and not tb_only:
             ds["footprint_id"] = (
-                "xy",
-                np.ravel_multi_index((ds.x.values, ds.y.values), dims_swath),
+                ("x", "y"),
+                x_ix.astype("int64")[:, None] * dims_swath[1]
+                + y_ix.astype("int64")[None, :],
             )
-            ds = ds.unstack()
             ds["footprint_id"].attrs = dict(
                 standard_name="footprint_id",
                 long_name="footprint id",
@@ -423,11 +525,11 @@ def read_gpm_l1c_swath(
                 "along-track (x) bin",
             )
 
-        # add global attributes
-        ds.attrs = {
-            ab.split("=")[0]: ab.split("=")[1]
+        # add global attributes; partition scans each entry only once
+        ds.attrs = dict(
+            ab.partition("=")[::2]
             for ab in f.attrs["FileHeader"].decode().split(";\n")[:-1]
-        }
+        )
 
     return ds
 
@@ -446,17 +548,26 @@ def extract_time(swath_data):
     time: scan time numpy array
     """
 
-    time = {
-        "year": swath_data["ScanTime"]["Year"],
-        "month": swath_data["ScanTime"]["Month"],
-        "day": swath_data["ScanTime"]["DayOfMonth"],
-        "hour": swath_data["ScanTime"]["Hour"],
-        "minute": swath_data["ScanTime"]["Minute"],
-        "second": swath_data["ScanTime"]["Second"],
-        "millisecond": swath_data["ScanTime"]["MilliSecond"],
-    }
+    scan_time = swath_data["ScanTime"]
+
+    year = scan_time["Year"][:].astype("int64")
+    month = scan_time["Month"][:].astype("int64")
+    day = scan_time["DayOfMonth"][:].astype("int64")
+    hour = scan_time["Hour"][:].astype("int64")
+    minute = scan_time["Minute"][:].astype("int64")
+    second = scan_time["Second"][:].astype("int64")
+    millisecond = scan_time["MilliSecond"][:].astype("int64")
+
+    # compose datetime64 with a few vector operations instead of a
+    # per-scan Timestamp construction through pd.to_datetime
+    date = (
+        (year - 1970).astype("datetime64[Y]")
+        + (month - 1).astype("timedelta64[M]")
+    ).astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
 
-    time = pd.to_datetime(time).values
+    time = date.astype("datetime64[ms]") + (
+        hour * 3600000 + minute * 60000 + second * 1000 + millisecond
+    ).astype("timedelta64[ms]")
 
     return time
 
@@ -479,19 +590,62 @@ def roi_index(lat, lon, roi):
 
     lon0, lon1, lat0, lat1 = roi
 
-    ix = np.any(
-        (lon >= lon0) * (lon < lon1) * (lat >= lat0) * (lat < lat1), axis=1
-    )
+    # combine the comparisons in place instead of multiplying four full
+    # boolean temporaries
+    inside = lon >= lon0
+    inside &= lon < lon1
+    inside &= lat >= lat0
+    inside &= lat < lat1
+
+    ix = inside.any(axis=1)
 
     return ix
 
 
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_any(lat, lon, center_lat, center_lon, max_distance):
+        """
+        Returns per scan whether any pixel lies within max_distance
+        (meters, great-circle) of the center point. Exits each scan on
+        the first hit.
+        """
+
+        n_scan, n_pix = lat.shape
+        out = np.zeros(n_scan, dtype=np.bool_)
+
+        r = 6371000.0
+        deg2rad = np.pi / 180.0
+        clat = center_lat * deg2rad
+        clon = center_lon * deg2rad
+        cos_clat = np.cos(clat)
+
+        for i in prange(n_scan):
+            for j in range(n_pix):
+                plat = lat[i, j] * deg2rad
+                sdlat = np.sin((plat - clat) / 2.0)
+                sdlon = np.sin((lon[i, j] * deg2rad - clon) / 2.0)
+                a = sdlat * sdlat + np.cos(plat) * cos_clat * sdlon * sdlon
+                if 2.0 * r * np.arcsin(np.sqrt(a)) <= max_distance:
+                    out[i] = True
+                    break
+
+        return out
+
+
 def distance_index(lat, lon, center_lat, center_lon, max_distance):
     """
     Returns along-track index where at least one pixel of the scan lies within
     a certain distance from a center point. This function is an alternative
     to roi_index() for the Arctic.
 
+    With numba installed, the distance check runs as a parallel
+    great-circle kernel that skips the map projection entirely and stops
+    at the first pixel within range of each scan. Without numba, the
+    footprints are projected to polar stereographic coordinates and
+    thresholded on the Euclidean distance as before.
+
     Parameters
     ----------
     lat: latitude
@@ -505,6 +659,11 @@ def distance_index(lat, lon, center_lat, center_lon, max_distance):
     ix: index of length number of scans
     """
 
+    if HAS_NUMBA:
+        return _haversine_any(
+            lat, lon, float(center_lat), float(center_lon), float(max_distance)
+        )
+
     # project coordinates into polar stereographic projection
     sat_points = np.array(project_crs(lon=lon, lat=lat)).T
     center_point = np.array(project_crs(lon=center_lon, lat=center_lat))
@@ -571,44 +730,26 @@ def get_files(instrument, satellite, date=None, time=None, time_offset=None):
         assert date is not None
 
     if time is None and time_offset is None:
+        all_files = sorted(_granule_index(instrument, satellite).values())
         date = pd.Timestamp(date).strftime("%Y%m%d")
-        files = sorted(
-            glob(
-                os.path.join(
-                    os.environ["PATH_SAT"],
-                    "gpm_l1c",
-                    f"1C.{FILENAME_SAT[(instrument, satellite)]}.XCAL*-V.{date}-S*.HDF5",
-                )
-            )
-        )
+        files = [f for f in all_files if f"-V.{date}-S" in os.path.basename(f)]
 
     else:
-        files = np.sort(
-            glob(
-                os.path.join(
-                    os.environ["PATH_SAT"],
-                    "gpm_l1c",
-                    f"1C.{FILENAME_SAT[(instrument, satellite)]}.XCAL*-V.*-S*.HDF5",
-                )
-            )
-        )
+        all_files, start_time, end_time = _file_times(instrument, satellite)
 
-        # get start time from start date and start time
-        start_time = [s[-41:-33] + s[-31:-25] for s in files]
-        start_time = pd.to_datetime(start_time, format="%Y%m%d%H%M%S").values
+        # the listing is sorted by start time, so two binary searches
+        # bound the orbits starting inside the window
+        lo = np.searchsorted(start_time, time - time_offset)
+        hi = np.searchsorted(start_time, time + time_offset, side="right")
 
-        # get end time from start date and end time
-        end_time = [s[-41:-33] + s[-23:-17] for s in files]
-        end_time = pd.to_datetime(end_time, format="%Y%m%d%H%M%S").values
+        # orbits starting before the window can still end inside it
+        while lo > 0 and end_time[lo - 1] > time - time_offset:
+            lo -= 1
 
-        # correction of end time by one day if needed
-        next_day = (end_time - start_time) < np.timedelta64(0, "s")
-        end_time[next_day] += np.timedelta64(1, "D")
-
-        ix = (np.abs(start_time - time) <= time_offset) | (
-            np.abs(end_time - time) < time_offset
+        ix = (np.abs(start_time[lo:hi] - time) <= time_offset) | (
+            np.abs(end_time[lo:hi] - time) < time_offset
         )
-        files = list(files[ix])
+        files = list(all_files[lo:hi][ix])
 
     return files
 
@@ -668,38 +809,65 @@ def in_roi(
         time_offset=time_offset,
     )
 
-    granules = []
-    for file in files:
-        with h5py.File(file, "r") as f:
+    def check_file(file):
+        with h5py.File(file, "r", **_H5_CACHE_KWDS) as f:
             s0 = SWATHS[instrument][0]
 
-            if isinstance(roi, list):
-                ix = roi_index(
-                    lat=f[s0]["Latitude"][:],
-                    lon=f[s0]["Longitude"][:],
-                    roi=roi,
-                )
-            else:
-                ix = distance_index(
-                    lat=f[s0]["Latitude"][:],
-                    lon=f[s0]["Longitude"][:],
-                    center_lat=center_lat,
-                    center_lon=center_lon,
-                    max_distance=max_distance,
-                )
-
+            # with a temporal filter, test the small scan time arrays
+            # first and skip the lat/lon read when no scan qualifies
+            ix_t = None
             if time is not None:
                 ix_t = time_index(
                     scan_time=extract_time(f[s0]),
                     time=time,
                     time_offset=time_offset,
                 )
+                if not np.any(ix_t):
+                    return False
+
+            lat_ds = f[s0]["Latitude"]
+            lon_ds = f[s0]["Longitude"]
+
+            # stream the coordinates one on-disk chunk at a time and
+            # stop at the first chunk with a qualifying scan, instead of
+            # slurping the full arrays per file
+            if lat_ds.chunks:
+                chunk_sels = lat_ds.iter_chunks()
+            else:
+                chunk_sels = [(slice(None), slice(None))]
+
+            for sel in chunk_sels:
+                if isinstance(roi, list):
+                    ix = roi_index(lat=lat_ds[sel], lon=lon_ds[sel], roi=roi)
+                else:
+                    ix = distance_index(
+                        lat=lat_ds[sel],
+                        lon=lon_ds[sel],
+                        center_lat=center_lat,
+                        center_lon=center_lon,
+                        max_distance=max_distance,
+                    )
 
                 # merge temporal and spatial filters
-                ix = ix * ix_t
+                if ix_t is not None:
+                    ix = ix * ix_t[sel[0]]
+
+                if np.any(ix):
+                    return True
+
+        return False
+
+    if not files:
+        return []
+
+    # the files are independent and libhdf5 releases the GIL during
+    # reads, so check them concurrently
+    with ThreadPoolExecutor(max_workers=min(len(files), 8)) as pool:
+        hits = list(pool.map(check_file, files))
 
-        if np.any(ix):
-            granules.append(file.split(".")[-3])
+    granules = [
+        file.split(".")[-3] for file, hit in zip(files, hits) if hit
+    ]
 
     return granules
 
@@ -717,8 +885,7 @@ def project_crs(lon, lat):
     y: y-coordinate of north polar stereographic projection
     """
 
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:3413")
-    x, y = transformer.transform(lat, lon)
+    x, y = _TRANSFORMER_4326_3413.transform(lat, lon)
 
     return x, y
 
@@ -773,6 +940,52 @@ def get_granules(
     return granules_dct
 
 
+def rechunk_gpm_l1c(path, out, scans_per_chunk=256):
+    """
+    Copies a granule with every dataset rechunked contiguously along the
+    scan dimension. Useful to pre-process files whose producer chunking
+    does not match the along-track slicing of the readers here.
+
+    Parameters
+    ----------
+    path: source HDF5 file
+    out: destination HDF5 file
+    scans_per_chunk: chunk length along the scan dimension
+    """
+
+    with h5py.File(path, "r") as src, h5py.File(out, "w") as dst:
+
+        def copy(name, obj):
+            if not isinstance(obj, h5py.Dataset):
+                dst.require_group(name).attrs.update(obj.attrs)
+                return
+
+            chunks = None
+            if obj.chunks is not None and obj.ndim >= 1 and obj.shape[0]:
+                chunks = (
+                    min(scans_per_chunk, obj.shape[0]),
+                ) + obj.shape[1:]
+
+            dset = dst.create_dataset(
+                name,
+                shape=obj.shape,
+                dtype=obj.dtype,
+                chunks=chunks,
+                compression=obj.compression,
+                compression_opts=obj.compression_opts,
+            )
+
+            if obj.size:
+                arr = np.empty(obj.shape, dtype=obj.dtype)
+                obj.read_direct(arr)
+                dset[...] = arr
+
+            dset.attrs.update(obj.attrs)
+
+        src.visititems(copy)
+        dst.attrs.update(src.attrs)
+
+
 def flag_gpml1c(ds, verbose=False):
     """
     Flags gpm l1c based on the provided quality mask and an additional filter
@@ -798,31 +1011,38 @@ def flag_gpml1c(ds, verbose=False):
     ds: same dataset with flagged Tb set to nan
     """
 
+    # work on the raw buffer; each .where would allocate a tb-sized copy
+    tb = ds["tb"].values
+    y_axis = ds["tb"].dims.index("y")
+
     # set missing tb to nan (this included all errors)
-    ds["tb"] = ds.tb.where(ds["tb"] > 0)
+    tb[tb <= 0] = np.nan
 
     # filter calculation: True=remove values
-    fltr = ds.tb.std("y") < 0.1
+    fltr = np.nanstd(tb, axis=y_axis, keepdims=True) < 0.1
 
     # number of pixels/scans that are filtered
-    n = np.sum(fltr.values)
+    n = np.sum(fltr)
 
     # data range before filter
-    tb00 = ds["tb"].min().item()
-    tb11 = ds["tb"].max().item()
+    if verbose:
+        tb00 = np.nanmin(tb)
+        tb11 = np.nanmax(tb)
 
-    # apply filters
-    ds["tb"] = ds.tb.where(~fltr)
+    # apply filters in place
+    tb[np.broadcast_to(fltr, tb.shape)] = np.nan
 
     if verbose:
         print(f"Value range of instrument: {tb00}..{tb11}")
         if n > 0:
-            tb0 = ds["tb"].min().item()
-            tb1 = ds["tb"].max().item()
+            tb0 = np.nanmin(tb)
+            tb1 = np.nanmax(tb)
             print(f"New value range of instrument: {tb0}..{tb1}")
 
-            flags = np.unique(ds.quality.where(fltr).values)
-            flags = flags[~np.isnan(flags)]
+            # quality does not depend on channel: report the flags of
+            # all scans with at least one filtered channel
+            scan_fltr = fltr.any(axis=tuple(range(1, fltr.ndim)))
+            flags = np.unique(ds.quality.values[scan_fltr])
             print(f"{n} scans removed by own scan line filter: {flags}")
 
     return ds
@@ -4,12 +4,12 @@ Reads GPS/INS data from ac3airborne intake catalog.
 
 import os
 
-import ac3airborne
 from dotenv import load_dotenv
 
+from lizard.readers._meta import get_catalog
+
 load_dotenv()
 
-CAT = ac3airborne.get_intake_catalog()
 PATH_CACHE_INTAKE = dict(
     storage_options={
         "simplecache": dict(
@@ -49,7 +49,7 @@ def read_gps_ins(flight_id):
     mission, platform, name = flight_id.split("_")
 
     if mission == "HALO-AC3" and platform == "HALO":
-        ds = CAT[mission][platform]["GPS_INS"][flight_id](
+        ds = get_catalog()[mission][platform]["GPS_INS"][flight_id](
             **PATH_CACHE_INTAKE, **CRED
         ).read()
         ds = ds.rename({"yaw": "heading"})
@@ -60,7 +60,7 @@ def read_gps_ins(flight_id):
         ds["heading"][ds["heading"] > 180] -= 360
 
     else:
-        ds = CAT[mission][platform]["GPS_INS"][flight_id](
+        ds = get_catalog()[mission][platform]["GPS_INS"][flight_id](
             **PATH_CACHE_INTAKE
         ).read()
 
@@ -3,18 +3,25 @@ Read HALO KT-19 from intake.
 """
 
 import os
+from functools import lru_cache
 
-import ac3airborne
+from lizard.readers._meta import get_catalog
 
-CAT = ac3airborne.get_intake_catalog()
 
-CRED = dict(user=os.environ["AC3_USER"], password=os.environ["AC3_PASSWORD"])
-
-kwds = {
-    "simplecache": dict(
-        cache_storage=os.environ["PATH_CACHE_INTAKE"], same_names=True
+@lru_cache(maxsize=1)
+def _cred():
+    return dict(
+        user=os.environ["AC3_USER"], password=os.environ["AC3_PASSWORD"]
     )
-}
+
+
+@lru_cache(maxsize=1)
+def _kwds():
+    return {
+        "simplecache": dict(
+            cache_storage=os.environ["PATH_CACHE_INTAKE"], same_names=True
+        )
+    }
 
 
 def read_halo_kt19(flight_id):
@@ -34,8 +41,8 @@ def read_halo_kt19(flight_id):
 
     mission, platform, name = flight_id.split("_")
 
-    ds = CAT[mission][platform]["KT19"][flight_id](
-        storage_options=kwds, **CRED
+    ds = get_catalog()[mission][platform]["KT19"][flight_id](
+        storage_options=_kwds(), **_cred()
     ).read()
 
     ds = ds.drop(["temp_KT19", "emis"])
@@ -4,17 +4,42 @@ Read HAMP Tbs from intake.
 
 import os
 
-import ac3airborne
 import numpy as np
 import pandas as pd
 import xarray as xr
 
 from lizard.ac3airlib import day_of_flight, get_all_flights
 
-CAT = ac3airborne.get_intake_catalog()
 
 CRED = dict(user=os.environ["AC3_USER"], password=os.environ["AC3_PASSWORD"])
 
+PATH_HAMP = "/data/obs/campaigns/halo-ac3/halo/hamp/"
+
+# sub-second offsets of the four samples that share one time stamp
+DT = np.array([0, 250, 500, 750], dtype="timedelta64[ms]")
+
+# channel number of each frequency in file order, as expected by the
+# filter files, and the permutation that sorts the channels
+CHAN = np.array(
+    [20, 21, 22, 23, 24, 25, 15, 16, 17, 18, 19]
+    + [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14]
+)
+PERM = np.argsort(CHAN)
+CHAN_SORTED = CHAN[PERM]
+
+
+def _hamp_path(flight_id):
+    """
+    Local path of the processed HAMP Tb file of a research flight.
+    """
+
+    mission, platform, name = flight_id.split("_")
+    date = day_of_flight(flight_id).strftime("%Y%m%d")
+
+    return os.path.join(
+        PATH_HAMP, f"HALO-AC3_HALO_hamp_radiometer_{date}_{name}.nc"
+    )
+
 
 def read_hamp(flight_id):
     """
@@ -35,11 +60,16 @@ def read_hamp(flight_id):
     ds: xarray Dataset with HAMP Tbs
     """
 
-    mission, platform, name = flight_id.split("_")
+    ds = xr.open_dataset(_hamp_path(flight_id))
+
+    return _convert_hamp(ds, flight_id)
 
-    date = day_of_flight(flight_id).strftime("%Y%m%d")
-    ds = xr.open_dataset(os.path.join("/data/obs/campaigns/halo-ac3/halo/hamp/",
-                                      f"HALO-AC3_HALO_hamp_radiometer_{date}_{name}.nc"))
+
+def _convert_hamp(ds, flight_id):
+    """
+    Renames HAMP variables, applies the calibration offset, and sorts the
+    channels as expected by the filter files.
+    """
 
     ds = ds.drop(["freq", "surface_mask", "interpolate_flag"])
     ds = ds.rename({"uniRadiometer_freq": "frequency", "TB": "tb"})
@@ -47,46 +77,27 @@ def read_hamp(flight_id):
     # apply calibration
     ds = apply_calibration(ds, flight_id)
 
-    # channel order as expected by the filter files
-    ds["channel"] = (
-        "frequency",
-        np.array(
-            [
-                20,
-                21,
-                22,
-                23,
-                24,
-                25,
-                15,
-                16,
-                17,
-                18,
-                19,
-                1,
-                2,
-                3,
-                4,
-                5,
-                6,
-                7,
-                8,
-                9,
-                10,
-                11,
-                12,
-                13,
-                14,
-            ]
-        ),
-    )
+    # apply the precomputed permutation, so the channels come out sorted
+    # in one gather instead of sorting with a reindex after swap_dims
+    ds = ds.isel(frequency=PERM)
+    ds["channel"] = ("frequency", CHAN_SORTED)
     ds = ds.swap_dims({"frequency": "channel"})
     ds = ds.reset_coords()
-    ds = ds.sel(channel=np.sort(ds.channel))
 
     return ds
 
 
+def _preprocess_hamp(ds):
+    """
+    Per-file callback for open_mfdataset. The flight id is recovered from
+    the file name, so the conversions can run inside the dask scheduler.
+    """
+
+    name = os.path.basename(ds.encoding["source"]).split("_")[-1][:-3]
+
+    return _convert_hamp(ds, f"HALO-AC3_HALO_{name}")
+
+
 def read_hamp_all():
     """
     Read all HAMP observations into a single dask array
@@ -99,13 +110,17 @@ def read_hamp_all():
     flight_ids = get_all_flights("HALO-AC3", "HALO")
     flight_ids.remove("HALO-AC3_HALO_RF00")
 
-    lst_ds = []
-    for flight_id in flight_ids:
-        ds = read_hamp(flight_id)
-        ds = ds.chunk({"time": 100000})
-        lst_ds.append(ds)
-
-    ds = xr.concat(lst_ds, dim="time", data_vars=["tb"])
+    ds = xr.open_mfdataset(
+        [_hamp_path(flight_id) for flight_id in flight_ids],
+        combine="nested",
+        concat_dim="time",
+        parallel=True,
+        chunks={"time": 100000},
+        preprocess=_preprocess_hamp,
+        data_vars=["tb"],
+        coords="minimal",
+        compat="override",
+    )
 
     return ds
 
@@ -127,14 +142,35 @@ def apply_calibration(ds, flight_id):
         )
     )
 
-    slope = ds_calib["slope"].sel(freq=ds["frequency"], date=date_str)
-    offset = ds_calib["offset"].sel(freq=ds["frequency"], date=date_str)
-
-    ds["tb"] = slope * ds["tb"] + offset
+    # align the coefficients once to the file's frequency order and apply
+    # them as plain numpy arrays, instead of letting xarray broadcast the
+    # labeled coefficients to the size of tb
+    ds_calib = ds_calib.sel(freq=ds["frequency"].values, date=date_str)
+    slope = ds_calib["slope"].values
+    offset = ds_calib["offset"].values
+
+    tb = ds["tb"].data
+    if isinstance(tb, np.ndarray):
+        # two in-place passes over tb, no temporaries
+        np.multiply(tb, slope, out=tb)
+        np.add(tb, offset, out=tb)
+    else:
+        # dask-backed tb: keep the correction lazy
+        ds["tb"] = (ds["tb"].dims, tb * slope + offset)
 
     return ds
 
 
+def _check_sampling(ds):
+    """
+    Asserts that every time stamp occurs exactly four times, i.e., the
+    sampling interval is constant.
+    """
+
+    ix = np.unique(ds.time.values, return_index=True)[1]
+    assert np.all(np.diff(ix) == 4)
+
+
 def read_hamp_separate():
     """
     Reader for separate HAMP channels
@@ -152,27 +188,14 @@ def read_hamp_separate():
     times = pd.date_range(flight["takeoff"], flight["landing"], freq="250ms")
 
     # make sure, that sampling interval is constant
-    _, ix = np.unique(ds1.time, return_index=True)
-    assert (ix[1:] - ix[:-1] != 4).sum() == 0
-
-    _, ix = np.unique(ds2.time, return_index=True)
-    assert (ix[1:] - ix[:-1] != 4).sum() == 0
-
-    _, ix = np.unique(ds3.time, return_index=True)
-    assert (ix[1:] - ix[:-1] != 4).sum() == 0
+    for ds_i in (ds1, ds2, ds3):
+        _check_sampling(ds_i)
 
     # sampling interval is 0.25 s, but this is not in the time stamp
-    # therefore modify the time stamp
-    dt = np.array([np.timedelta64(t, "ms") for t in [0, 250, 500, 750]])
-
-    dt1 = np.tile(dt, int(len(ds1.time) / 4))
-    ds1["time"] = ds1["time"] + dt1
-
-    dt2 = np.tile(dt, int(len(ds2.time) / 4))
-    ds2["time"] = ds2["time"] + dt2
-
-    dt3 = np.tile(dt, int(len(ds3.time) / 4))
-    ds3["time"] = ds3["time"] + dt3
+    # therefore modify the time stamp by broadcasting the sub-second
+    # offsets over the groups of four samples
+    for ds_i in (ds1, ds2, ds3):
+        ds_i["time"] = (ds_i["time"].values.reshape(-1, 4) + DT).ravel()
 
     # reindex
     ds1 = ds1.reindex({"time": times})
@@ -4,10 +4,59 @@ Reads land shapefile from Norwegian Polar Institute to Geopandas.
 
 
 import os
+from functools import lru_cache
 
 import geopandas
 
 
+@lru_cache(maxsize=2)
+def _read_shapefile(filename):
+    """
+    Parses one of the Norwegian Polar Institute shapefiles once. Shapefile
+    IO is slow, so repeated calls reuse the cached GeoDataFrame.
+
+    A GeoParquet copy is kept next to the shapefile and preferred on
+    later reads: columnar WKB reads avoid the per-feature OGR dispatch.
+    The copy is built once from the shapefile if it does not exist yet.
+    """
+
+    path = os.path.join(
+        os.environ["PATH_SEC"], "data/land_cover/NP_S100_SHP", filename
+    )
+    path_parquet = path[:-4] + ".parquet"
+
+    if os.path.exists(path_parquet):
+        return geopandas.read_parquet(path_parquet)
+
+    gdf = geopandas.GeoDataFrame.from_file(path)
+
+    try:
+        gdf.to_parquet(path_parquet, compression="zstd")
+    except (ImportError, OSError):
+        # no pyarrow or read-only data directory: keep reading the
+        # shapefile, the in-process cache still avoids repeated parsing
+        pass
+
+    # build the spatial index once at load time, so point-in-polygon
+    # queries on the cached frame do not pay the tree construction
+    gdf.sindex
+
+    return gdf
+
+
+@lru_cache(maxsize=8)
+def _reproject_shapefile(filename, proj4):
+    """
+    Caches the reprojected copies per target projection string, with the
+    spatial index already built.
+    """
+
+    gdf = _read_shapefile(filename).to_crs(proj4)
+    gdf.sindex
+
+    return gdf
+
+
 def read_land():
     """
     Reads land shapefile from Norwegian Polar Institute to Geopandas.
@@ -17,14 +66,8 @@ def read_land():
     Geopandas DataFrame that contains land polygons of Svalbard.
     """
 
-    gdf = geopandas.GeoDataFrame.from_file(
-        os.path.join(
-            os.environ["PATH_SEC"],
-            "data/land_cover/NP_S100_SHP/S100_Land_f.shp",
-        )
-    )
-
-    return gdf
+    # copy, so callers can modify the result without touching the cache
+    return _read_shapefile("S100_Land_f.shp").copy()
 
 
 def read_glaciers():
@@ -36,14 +79,7 @@ def read_glaciers():
     Geopandas DataFrame that contains glacier polygons of Svalbard.
     """
 
-    gdf = geopandas.GeoDataFrame.from_file(
-        os.path.join(
-            os.environ["PATH_SEC"],
-            "data/land_cover/NP_S100_SHP/S100_Isbreer_f.shp",
-        )
-    )
-
-    return gdf
+    return _read_shapefile("S100_Isbreer_f.shp").copy()
 
 
 def read_land_crt(crs):
@@ -56,7 +92,7 @@ def read_land_crt(crs):
     a cartopy projection
     """
 
-    return read_land().to_crs(crs.proj4_init)
+    return _reproject_shapefile("S100_Land_f.shp", crs.proj4_init).copy()
 
 
 def read_glaciers_crt(crs):
@@ -69,4 +105,4 @@ def read_glaciers_crt(crs):
     a cartopy projection
     """
 
-    return read_glaciers().to_crs(crs.proj4_init)
+    return _reproject_shapefile("S100_Isbreer_f.shp", crs.proj4_init).copy()
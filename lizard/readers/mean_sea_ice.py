@@ -11,13 +11,15 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def read_mean_sea_ice(mission):
+def read_mean_sea_ice(mission, chunks="auto"):
     """
     Read mean sea ice concentration for campaign period.
 
     Parameters
     -------
     mission: name of field campaign
+    chunks: chunking passed to xr.open_dataset. With the default "auto"
+        the file is opened lazily. Pass None to load eagerly.
 
     Returns
     -------
@@ -31,7 +33,8 @@ def read_mean_sea_ice(mission):
             mission.lower(),
             "auxiliary/sea_ice/avg",
             f"{mission}_mean_sic_asi-AMSR2-n6250-v5.4.nc",
-        )
+        ),
+        chunks=chunks,
     )
 
     return ds
@@ -4,15 +4,21 @@ Read HAMP MIRA radar reflectivity
 
 import os
 
-import ac3airborne
 import numpy as np
 import xarray as xr
-from scipy.interpolate import interp1d
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+
+except ImportError:
+    HAS_NUMBA = False
 
 from lizard.ac3airlib import get_all_flights, meta
 from lizard.readers.gps_ins import read_gps_ins
+from lizard.readers._meta import get_catalog
 
-CAT = ac3airborne.get_intake_catalog()
 
 CRED = dict(user=os.environ["AC3_USER"], password=os.environ["AC3_PASSWORD"])
 
@@ -60,7 +66,7 @@ def read_mira(flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    ds = CAT[mission][platform]["HAMP_RADAR"][flight_id](
+    ds = get_catalog()[mission][platform]["HAMP_RADAR"][flight_id](
         storage_options=kwds, **CRED
     ).read()
 
@@ -71,6 +77,109 @@ def read_mira(flight_id):
     return ds
 
 
+if HAS_NUMBA:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _interp_rows(hs, zs, height, out):
+        n_time, n_range = hs.shape
+        n_height = height.shape[0]
+        for j in prange(n_time):
+            # height and hs[j] are both ascending, so one monotonic walk
+            # over the row covers all targets
+            k = 1
+            for i in range(n_height):
+                h = height[i]
+                if h < hs[j, 0] or h > hs[j, n_range - 1]:
+                    out[j, i] = np.nan
+                    continue
+                while k < n_range - 1 and hs[j, k] < h:
+                    k += 1
+                w = (h - hs[j, k - 1]) / (hs[j, k] - hs[j, k - 1])
+                out[j, i] = zs[j, k - 1] + w * (zs[j, k] - zs[j, k - 1])
+
+
+def _interp_height(height_sig, ze, height):
+    """
+    Linearly interpolate every time step of ze from its signal heights onto
+    the common height grid in one vectorized pass. Values outside the range
+    of a time step are set to nan.
+
+    Parameters
+    ----------
+    height_sig: signal height of each radar bin (time, range)
+    ze: radar reflectivity in linear units (time, range)
+    height: regular height grid (height)
+
+    Returns
+    -------
+    ze interpolated onto the height grid (time, height)
+    """
+
+    # sort the signal heights per row (they decrease with range)
+    order = np.argsort(height_sig, axis=1)
+    hs = np.take_along_axis(height_sig, order, axis=1)
+    zs = np.take_along_axis(ze, order, axis=1)
+
+    if HAS_NUMBA:
+        # one thread per time step with a monotonic walk over the row,
+        # O(range + height) instead of height * log(range)
+        ze_reg = np.empty((hs.shape[0], height.shape[0]))
+        _interp_rows(hs, zs, height.astype(float), ze_reg)
+        return ze_reg
+
+    n_time, n_range = hs.shape
+
+    # rows with nan signal heights (e.g. gps altitude gaps) would break
+    # the global sort order below, corrupting all rows after them; they
+    # are interpolated individually over their finite part, while the
+    # clean rows take the fast path
+    nan_rows = np.isnan(hs[:, -1])  # nans sort to the row ends
+    if nan_rows.any():
+        ze_reg = np.full((n_time, height.shape[0]), np.nan)
+        if not nan_rows.all():
+            ze_reg[~nan_rows] = _interp_height(
+                height_sig[~nan_rows], ze[~nan_rows], height
+            )
+        for j in np.flatnonzero(nan_rows):
+            sel = ~np.isnan(hs[j])
+            if sel.sum() > 1:
+                ze_reg[j] = np.interp(
+                    height,
+                    hs[j, sel],
+                    zs[j, sel],
+                    left=np.nan,
+                    right=np.nan,
+                )
+        return ze_reg
+
+    # one global searchsorted over all rows: shift every row by a unique
+    # offset larger than the overall height span so rows do not overlap
+    gap = hs.max() - min(hs.min(), height.min()) + height.max() + 1
+    row_offset = np.arange(n_time)[:, np.newaxis] * gap
+    ix = np.searchsorted(
+        (hs + row_offset).ravel(), (height[np.newaxis, :] + row_offset).ravel()
+    ).reshape(n_time, -1)
+    ix -= np.arange(n_time)[:, np.newaxis] * n_range
+
+    # gather the two neighbors and apply linear weights
+    i1 = np.clip(ix, 1, n_range - 1)
+    i0 = i1 - 1
+    x0 = np.take_along_axis(hs, i0, axis=1)
+    x1 = np.take_along_axis(hs, i1, axis=1)
+    z0 = np.take_along_axis(zs, i0, axis=1)
+    z1 = np.take_along_axis(zs, i1, axis=1)
+    w = (height[np.newaxis, :] - x0) / (x1 - x0)
+    ze_reg = z0 + w * (z1 - z0)
+
+    # outside the signal height range of a time step
+    outside = (height[np.newaxis, :] < hs[:, :1]) | (
+        height[np.newaxis, :] > hs[:, -1:]
+    )
+    ze_reg[outside] = np.nan
+
+    return ze_reg
+
+
 def height_grid(da_ze, flight_id):
     """
     Interpolate signal on regular height grid (no curves considered)
@@ -94,20 +203,16 @@ def height_grid(da_ze, flight_id):
     # interpolate radar reflectivity onto regular height grid
     height_sig = (ds_gps.alt - da_ze.range).values  # (time, range)
     height = np.arange(-200, 14001, 30)  # (height)
-    ze = 10 ** (0.1 * da_ze.values)  # (time, range)
-    ze_reg = np.full((ze.shape[0], height.shape[0]), fill_value=np.nan)
-    for j in range(ze.shape[0]):
-        f = interp1d(
-            height_sig[j, :],
-            ze[j, :],
-            fill_value=np.nan,
-            kind="linear",
-            bounds_error=False,
-        )
-        ze_reg[j, :] = f(height)
-
-    # back to dbz
-    ze_reg = 10 * np.log10(ze_reg)
+    # to linear units, reusing one buffer instead of allocating a radar
+    # cube per operation
+    ze = da_ze.values * 0.1  # (time, range)
+    np.power(10.0, ze, out=ze)
+
+    ze_reg = _interp_height(height_sig, ze, height)
+
+    # back to dbz, in place on the freshly interpolated array
+    np.log10(ze_reg, out=ze_reg)
+    ze_reg *= 10
 
     ds = xr.Dataset()
     ds.coords["height"] = height
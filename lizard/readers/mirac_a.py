@@ -4,15 +4,14 @@ Read MiRAC-A from intake catalog
 
 import os
 
-import ac3airborne
 import xarray as xr
 from dotenv import load_dotenv
 
 from lizard.ac3airlib import day_of_flight
+from lizard.readers._meta import get_catalog
 
 load_dotenv()
 
-CAT = ac3airborne.get_intake_catalog()
 PATH_CACHE_INTAKE = dict(
     storage_options={
         "simplecache": dict(
@@ -24,7 +23,7 @@ PATH_CACHE_INTAKE = dict(
 CRED = dict(user=os.environ["AC3_USER"], password=os.environ["AC3_PASSWORD"])
 
 
-def read_mirac_a(flight_id, offline=True, **xarray_kwargs):
+def read_mirac_a(flight_id, offline=True, chunks="auto", **xarray_kwargs):
     """
     Read MiRAC-A for given research flight.
     """
@@ -39,7 +38,8 @@ def read_mirac_a(flight_id, offline=True, **xarray_kwargs):
                 mission.lower(),
                 "p5/mirac_radar/compact",
                 f"{mission}_P5_MiRAC-A_{date.strftime('%Y%m%d')}_{name}.nc",
-            )
+            ),
+            chunks=chunks,
         )
 
         return ds
@@ -47,11 +47,11 @@ def read_mirac_a(flight_id, offline=True, **xarray_kwargs):
     else:
         try:
             if mission == "HALO-AC3":
-                ds = CAT[mission][platform]["MiRAC-A"][flight_id](
+                ds = get_catalog()[mission][platform]["MiRAC-A"][flight_id](
                     **PATH_CACHE_INTAKE, **CRED, xarray_kwargs=xarray_kwargs
                 ).read()
             else:
-                ds = CAT[mission][platform]["MiRAC-A"][flight_id](
+                ds = get_catalog()[mission][platform]["MiRAC-A"][flight_id](
                     **PATH_CACHE_INTAKE, xarray_kwargs=xarray_kwargs
                 ).read()
 
@@ -5,11 +5,32 @@ Read raw MiRAC-A TB for a given research flight
 import os
 from glob import glob
 
-import ac3airborne
 import numpy as np
 import xarray as xr
 
-meta = ac3airborne.get_flight_segments()
+from lizard.readers._meta import get_meta
+
+
+KEEP_VARS = ["tb", "t_rec", "sample_tms"]
+
+# variables to drop at decode time, inspected once from the first raw file
+_DROP_VARS = None
+
+
+def _drop_vars(file):
+    """
+    Lists the raw file variables that are not kept, so open_mfdataset never
+    loads them. The raw files all share one structure, so the list is built
+    once from the first file and reused afterwards.
+    """
+
+    global _DROP_VARS
+
+    if _DROP_VARS is None:
+        with xr.open_dataset(file) as ds:
+            _DROP_VARS = [v for v in ds.data_vars if v not in KEEP_VARS]
+
+    return _DROP_VARS
 
 
 def read_mirac_a_tb_raw(flight_id):
@@ -26,7 +47,7 @@ def read_mirac_a_tb_raw(flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    flight = meta[mission][platform][flight_id]
+    flight = get_meta()[mission][platform][flight_id]
     date = flight["date"]
 
     files = glob(
@@ -40,29 +61,35 @@ def read_mirac_a_tb_raw(flight_id):
         )
     )
 
-    ds_lst = []
-    for file in files:
-        ds_lst.append(xr.open_dataset(file)[["tb", "t_rec", "sample_tms"]])
-
-    if len(ds_lst) == 0:
+    if len(files) == 0:
         return
 
-    ds = xr.merge(ds_lst)
+    # open all raw files in parallel and drop the unused variables before
+    # they are ever read
+    ds = xr.open_mfdataset(
+        sorted(files),
+        combine="nested",
+        concat_dim="time",
+        parallel=True,
+        drop_variables=_drop_vars(files[0]),
+    )
 
     # add milliseconds
     ds["time"] = ds["time"] + ds.sample_tms.values.astype("timedelta64[ms]")
 
-    # sort by time
-    ds = ds.sel(time=np.sort(ds.time))
+    # sort by time, skipping the copy when the axis is already sorted
+    # (the common case after the millisecond correction)
+    times = ds.time.values
+    if not np.all(times[1:] >= times[:-1]):
+        ds = ds.isel(time=np.argsort(times, kind="stable"))
+
+    # remove millisecond variable
+    ds = ds.drop_vars("sample_tms")
 
     # get brightness temperature at full seconds (same was done for lidar)
     t = ds.time.values.astype("datetime64[s]")
     t = np.sort(np.unique(np.append(t, t + np.timedelta64(1, "s"))))
-    ds = ds.interp(
-        time=t,
-        method="linear",
-        kwargs=dict(fill_value=np.nan, bounds_error=False),
-    )
+    ds = _interp_time(ds, t)
 
     # drop times, where extrapolation was needed (all values are nan)
     ds = ds.sel(time=~ds["tb"].isnull())
@@ -70,7 +97,32 @@ def read_mirac_a_tb_raw(flight_id):
     # reduce to flight time
     ds = ds.sel(time=slice(flight["takeoff"], flight["landing"]))
 
-    # remove millisecond variable
-    ds = ds.drop_vars("sample_tms")
-
     return ds
+
+
+def _interp_time(ds, t):
+    """
+    Linear interpolation of all variables onto the time stamps t. Both time
+    axes are sorted, so one searchsorted locates all neighbors and the
+    variables are gathered directly in numpy, without the per-variable
+    scipy setup of ds.interp. Times outside the source range become nan.
+    """
+
+    src = ds.time.values.astype("datetime64[ns]").astype("int64")
+    dst = t.astype("datetime64[ns]").astype("int64")
+
+    i1 = np.clip(np.searchsorted(src, dst), 1, len(src) - 1)
+    i0 = i1 - 1
+    w = (dst - src[i0]) / (src[i1] - src[i0])
+    outside = (dst < src[0]) | (dst > src[-1])
+
+    ds_t = xr.Dataset(coords={"time": t}, attrs=ds.attrs)
+    for var in ds.data_vars:
+        v = ds[var].values
+        wv = w.reshape((-1,) + (1,) * (v.ndim - 1))
+        vi = v[i0] + wv * (v[i1] - v[i0])
+        vi[outside] = np.nan
+        ds_t[var] = (ds[var].dims, vi)
+        ds_t[var].attrs = ds[var].attrs
+
+    return ds_t
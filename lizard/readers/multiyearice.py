@@ -8,6 +8,10 @@ import pandas as pd
 import xarray as xr
 from osgeo import gdal
 
+# skip directory scans when opening files and allow a larger block cache
+gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "TRUE")
+gdal.SetConfigOption("GDAL_CACHEMAX", "1000")
+
 
 def read_myi(date):
     """
@@ -22,14 +22,13 @@ UTC    h   lon   lat  p     gs  pitch   roll     rh      T      u      v    tas
 
 import os
 
-import ac3airborne
 import pandas as pd
 from dotenv import load_dotenv
 
+from lizard.readers._meta import get_catalog, get_meta
+
 load_dotenv()
 
-META = ac3airborne.get_flight_segments()
-CAT = ac3airborne.get_intake_catalog()
 PATH_CACHE_INTAKE = dict(
     storage_options={
         "simplecache": dict(
@@ -50,7 +49,7 @@ def read_noseboom(flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    flight = META[mission][platform][flight_id]
+    flight = get_meta()[mission][platform][flight_id]
 
     if mission in ["ACLOUD", "AFLUX"]:
         print("WARNING: Using file from local server instead of intake.")
@@ -79,12 +78,12 @@ def read_noseboom(flight_id):
         return None
 
     else:
-        df = CAT[mission][platform]["NOSE_BOOM"][flight_id](
+        df = get_catalog()[mission][platform]["NOSE_BOOM"][flight_id](
             **PATH_CACHE_INTAKE
         ).read()
 
     df["t"] = pd.to_datetime(
-        df["t"], unit="s", origin=META[mission][platform][flight_id]["date"]
+        df["t"], unit="s", origin=get_meta()[mission][platform][flight_id]["date"]
     )
     ds = df.set_index("t").to_xarray()
     ds = ds.rename({"t": "time"})
@@ -8,7 +8,7 @@ from glob import glob
 import xarray as xr
 
 
-def read_pamtra_dropsondes(sonde_id):
+def read_pamtra_dropsondes(sonde_id, chunks="auto"):
     """
     Read PAMTRA simulation of dropsondes and ERA-5 above
     """
@@ -16,7 +16,8 @@ def read_pamtra_dropsondes(sonde_id):
     ds = xr.open_dataset(
         os.path.join(
             "/net/secaire/mech", "data/lwp_project/", f"pamtra_{sonde_id}.nc"
-        )
+        ),
+        chunks=chunks,
     )
 
     # select clear-sky sondes
@@ -4,12 +4,11 @@ Read PAMTRA simulation along flight track based on ERA-5
 
 import os
 
-import ac3airborne
 import numpy as np
 import xarray as xr
 
-CAT = ac3airborne.get_intake_catalog()
-META = ac3airborne.get_flight_segments()
+from lizard.readers._meta import get_catalog, get_meta
+
 PATH_CACHE_INTAKE = dict(
     storage_options={
         "simplecache": dict(
@@ -20,20 +19,20 @@ PATH_CACHE_INTAKE = dict(
 )
 
 
-def read_pamtra_era5(flight_id, frequency):
+def read_pamtra_era5(flight_id, frequency, chunks="auto"):
     """
     Read PAMTRA ERA-5 simulation along flight track
     """
 
-    mission, platfo
-    rm, name = flight_id.split("_")
+    mission, platform, name = flight_id.split("_")
 
     ds = xr.open_dataset(
         os.path.join(
             "/net/secaire/mech",
             "data/era5_pamtra/flights",
             f"ERA5_{flight_id}_passive.nc",
-        )
+        ),
+        chunks=chunks,
     )["tb"].sel(frequencies=frequency)
 
     # remove dimensions (what is lev_2?)
@@ -52,12 +51,12 @@ def read_pamtra_era5(flight_id, frequency):
 
     # time in pamtra is from gps_ins data on ac3airborne but not provided!
     ds_gps = (
-        CAT[mission]["P5"]["GPS_INS"][flight_id]
+        get_catalog()[mission]["P5"]["GPS_INS"][flight_id]
         .to_dask()
         .sel(
             time=slice(
-                META[mission]["P5"][flight_id]["takeoff"],
-                META[mission]["P5"][flight_id]["landing"],
+                get_meta()[mission]["P5"][flight_id]["takeoff"],
+                get_meta()[mission]["P5"][flight_id]["landing"],
             )
         )
     )
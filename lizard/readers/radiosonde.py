@@ -6,17 +6,17 @@ import datetime
 import os
 from glob import glob
 
-import ac3airborne
 import pandas as pd
 import xarray as xr
 from dotenv import load_dotenv
 
+from lizard.readers._meta import get_meta
+
 load_dotenv()
 
-META = ac3airborne.get_flight_segments()
 
 
-def read_radiosonde(flight_id=None, time=None):
+def read_radiosonde(flight_id=None, time=None, chunks="auto"):
     """
     Reads radiosonde closest to takeoff time of research flight or a certain
     time.
@@ -25,6 +25,8 @@ def read_radiosonde(flight_id=None, time=None):
     ----------
     flight_id: ac3airborne flight id
     time: time around which the closest radiosonde will be searched
+    chunks: chunking passed to xr.open_dataset. With the default "auto"
+        the file is opened lazily. Pass None to load eagerly.
 
     Returns
     -------
@@ -33,7 +35,7 @@ def read_radiosonde(flight_id=None, time=None):
 
     if flight_id is not None and time is None:
         mission, platform, name = flight_id.split("_")
-        time = META[mission][platform][flight_id]["takeoff"]
+        time = get_meta()[mission][platform][flight_id]["takeoff"]
 
     else:
         print(time)
@@ -56,13 +58,14 @@ def read_radiosonde(flight_id=None, time=None):
         os.path.join(
             os.environ["PATH_SEC"],
             f"data/radiosondes/ny_alesund/radiosonde_ny_alesund_{date_rs}.nc",
-        )
+        ),
+        chunks=chunks,
     )
 
     return ds
 
 
-def read_merged_radiosonde():
+def read_merged_radiosonde(chunks="auto"):
     """
     Reads merged radiosonde dataset from Ny-Alesund.
     """
@@ -75,7 +78,8 @@ def read_merged_radiosonde():
             "ny_alesund",
             "merge",
             "radiosonde_ny_alesund_merge.nc",
-        )
+        ),
+        chunks=chunks,
     )
 
     return ds
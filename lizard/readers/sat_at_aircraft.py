@@ -7,7 +7,7 @@ import os
 import xarray as xr
 
 
-def read_sat_at_aircraft(flight_id):
+def read_sat_at_aircraft(flight_id, chunks="auto"):
     """
     Read satellite tb that was extracted along flight track
 
@@ -25,13 +25,14 @@ def read_sat_at_aircraft(flight_id):
             os.environ["PATH_SEC"],
             "data/sea_ice_emissivity/sat_flight_track",
             f"{flight_id}_gpm_l1c.nc",
-        )
+        ),
+        chunks=chunks,
     )
 
     return ds
 
 
-def read_sat_at_aircraft_unique(flight_id):
+def read_sat_at_aircraft_unique(flight_id, chunks="auto"):
     """
     Read satelite observations that align with flight track
 
@@ -49,7 +50,8 @@ def read_sat_at_aircraft_unique(flight_id):
             os.environ["PATH_SEC"],
             "data/sea_ice_emissivity/sat_flight_track",
             f"{flight_id}_gpm_l1c_unique_ancil.nc",
-        )
+        ),
+        chunks=chunks,
     )
 
     return ds
@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-def read_sat_tracks(t0=None, t1=None):
+def read_sat_tracks(t0=None, t1=None, chunks="auto"):
     """
     Reads satellite tracks
 
@@ -19,10 +19,13 @@ def read_sat_tracks(t0=None, t1=None):
     -------
     t0: start time
     t1: end time
+    chunks: chunking passed to xr.open_dataset. With the default "auto"
+        the file is opened lazily. Pass None to load eagerly.
     """
 
     ds = xr.open_dataset(
-        os.path.join(os.environ["PATH_SAT"], "tracks/sat_tracks.nc")
+        os.path.join(os.environ["PATH_SAT"], "tracks/sat_tracks.nc"),
+        chunks=chunks,
     )
 
     if t0 is not None and t1 is not None:
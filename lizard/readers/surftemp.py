@@ -4,22 +4,40 @@ Read surface temperature data from local intake catalog
 
 import os
 
-import ac3airborne
 import intake
 
-META = ac3airborne.get_flight_segments()
-CAT = intake.open_catalog(
-    os.path.join(os.environ["PATH_DAT"], "obs/campaigns/intake/catalog.yaml")
-)
-os.environ["LOCAL_DATA"] = "/data/obs/campaigns/"
-PATH_CACHE_INTAKE = dict(
-    storage_options={
-        "simplecache": dict(
-            cache_storage=os.environ["PATH_CACHE_INTAKE"],
-            same_names=True,
+from lizard.readers._meta import get_meta
+
+_CAT = None
+
+
+def _get_cat():
+    """
+    Opens the local intake catalog on first use instead of at import.
+    """
+
+    global _CAT
+
+    if _CAT is None:
+        _CAT = intake.open_catalog(
+            os.path.join(
+                os.environ["PATH_DAT"], "obs/campaigns/intake/catalog.yaml"
+            )
         )
-    }
-)
+        os.environ["LOCAL_DATA"] = "/data/obs/campaigns/"
+
+    return _CAT
+
+
+def _path_cache_intake():
+    return dict(
+        storage_options={
+            "simplecache": dict(
+                cache_storage=os.environ["PATH_CACHE_INTAKE"],
+                same_names=True,
+            )
+        }
+    )
 
 
 def read_surftemp(flight_id):
@@ -28,10 +46,10 @@ def read_surftemp(flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    flight = META[mission][platform][flight_id]
+    flight = get_meta()[mission][platform][flight_id]
 
-    ds = CAT[mission][platform]["ESA_CCI_SST"][flight_id](
-        **PATH_CACHE_INTAKE
+    ds = _get_cat()[mission][platform]["ESA_CCI_SST"][flight_id](
+        **_path_cache_intake()
     ).read()
 
     ds = ds.sel(time=slice(flight["takeoff"], flight["landing"]))
@@ -8,6 +8,10 @@ from osgeo import gdal
 
 from ..ac3airlib import day_of_flight
 
+# skip directory scans when opening files and allow a larger block cache
+gdal.SetConfigOption("GDAL_DISABLE_READDIR_ON_OPEN", "TRUE")
+gdal.SetConfigOption("GDAL_CACHEMAX", "1000")
+
 
 def read_worldview(flight_id):
     """
@@ -6,7 +6,6 @@ different meteorological satellites.
 
 import os
 
-import ac3airborne
 import cartopy.crs as ccrs
 import matplotlib.pyplot as plt
 import numpy as np
@@ -16,6 +15,8 @@ from dotenv import load_dotenv
 from mw_satellites import sat_colors
 from sat_tools import OSCAR
 
+from lizard.readers._meta import get_catalog, get_meta
+
 plt.ion()
 load_dotenv()
 
@@ -146,8 +147,8 @@ if __name__ == "__main__":
     axes[1, 0].set_ylabel("min(dist(sat, 80N, 0E)) [km]")
 
     # %% visualization of co-location with polar5
-    meta = ac3airborne.get_flight_segments()
-    cat = ac3airborne.get_intake_catalog()
+    meta = get_meta()
+    cat = get_catalog()
 
     # all flights
     flights = [
@@ -4,9 +4,7 @@ Write MiRAC-A TB level 1 files.
 
 import os
 
-import ac3airborne
-
-META = ac3airborne.get_flight_segments()
+from lizard.readers._meta import get_meta
 
 
 def write_mirac_a_tb_l1(ds, flight_id):
@@ -15,7 +13,7 @@ def write_mirac_a_tb_l1(ds, flight_id):
     """
 
     mission, platform, name = flight_id.split("_")
-    date = META[mission][platform][flight_id]["date"].strftime("%Y%m%d")
+    date = get_meta()[mission][platform][flight_id]["date"].strftime("%Y%m%d")
 
     ds.to_netcdf(
         os.path.join(
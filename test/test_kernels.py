@@ -0,0 +1,229 @@
+"""
+Equivalence tests for the rewritten numerical kernels. Each kernel is
+checked on synthetic arrays against the straightforward implementation it
+replaced (ds.interp, per-row np.interp, pd.to_datetime, np.unpackbits).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from lizard.bitflags import (
+    pack_bit_mask,
+    read_flag_xarray,
+    unpack_bit_mask,
+    write_flag_xarray,
+)
+from lizard.readers.gpm_l1c import extract_time
+from lizard.readers.mira import HAS_NUMBA, _interp_height
+from lizard.readers.mirac_a_tb_raw import _interp_time
+
+
+class TestInterpTime:
+    def test_matches_ds_interp(self):
+        """
+        _interp_time reproduces ds.interp on sorted datetime axes.
+        """
+
+        rng = np.random.default_rng(42)
+        src = np.datetime64("2022-03-21 10:00:00", "ms") + np.cumsum(
+            rng.integers(100, 2000, size=50)
+        ).astype("timedelta64[ms]")
+        ds = xr.Dataset(
+            {
+                "tb": ("time", rng.normal(200, 30, size=50)),
+                "t_rec": ("time", rng.normal(300, 5, size=50)),
+            },
+            coords={"time": src},
+        )
+
+        # target grid extends beyond the source range on both sides
+        t = np.arange(
+            src[0] - np.timedelta64(5, "s"),
+            src[-1] + np.timedelta64(5, "s"),
+            np.timedelta64(1, "s"),
+        )
+
+        ds_ref = ds.interp(
+            time=t,
+            method="linear",
+            kwargs=dict(fill_value=np.nan, bounds_error=False),
+        )
+        ds_new = _interp_time(ds, t)
+
+        for var in ["tb", "t_rec"]:
+            np.testing.assert_allclose(
+                ds_new[var].values, ds_ref[var].values, equal_nan=True
+            )
+
+
+class TestInterpHeight:
+    def _reference(self, height_sig, ze, height):
+        """
+        Per-row linear interpolation, as the old interp1d loop did it.
+        """
+
+        out = np.full((ze.shape[0], height.shape[0]), np.nan)
+        for j in range(ze.shape[0]):
+            order = np.argsort(height_sig[j])
+            out[j] = np.interp(
+                height,
+                height_sig[j][order],
+                ze[j][order],
+                left=np.nan,
+                right=np.nan,
+            )
+
+        return out
+
+    def _sample(self, rng, n_time=40, n_range=120):
+        """
+        Signal heights that decrease with range, as alt - range does.
+        """
+
+        alt = rng.uniform(8000, 10000, size=(n_time, 1))
+        height_sig = alt - np.arange(n_range) * 30.0
+        ze = rng.uniform(1e-3, 10.0, size=(n_time, n_range))
+
+        return height_sig, ze
+
+    def test_matches_interp1d_loop(self):
+        rng = np.random.default_rng(0)
+        height_sig, ze = self._sample(rng)
+        height = np.arange(-200, 14001, 30).astype(float)
+
+        ze_reg = _interp_height(height_sig, ze, height)
+
+        np.testing.assert_allclose(
+            ze_reg,
+            self._reference(height_sig, ze, height),
+            equal_nan=True,
+        )
+
+    def test_nan_height_stays_local(self):
+        """
+        A nan signal height must only affect its own time step, not the
+        global row offsets of the vectorized path.
+        """
+
+        rng = np.random.default_rng(1)
+        height_sig, ze = self._sample(rng)
+        height_sig[3, 50] = np.nan
+        height = np.arange(-200, 14001, 30).astype(float)
+
+        ze_reg = _interp_height(height_sig, ze, height)
+        ref = self._reference(height_sig, ze, height)
+
+        ok = np.ones(ze.shape[0], dtype=bool)
+        ok[3] = False
+        np.testing.assert_allclose(ze_reg[ok], ref[ok], equal_nan=True)
+
+    @pytest.mark.skipif(not HAS_NUMBA, reason="numba is not installed")
+    def test_numba_parity(self):
+        """
+        The numba kernel and the vectorized fallback agree.
+        """
+
+        from lizard.readers.mira import _interp_rows
+
+        rng = np.random.default_rng(2)
+        height_sig, ze = self._sample(rng)
+        height = np.arange(-200, 14001, 30).astype(float)
+
+        order = np.argsort(height_sig, axis=1)
+        hs = np.take_along_axis(height_sig, order, axis=1)
+        zs = np.take_along_axis(ze, order, axis=1)
+        out = np.empty((hs.shape[0], height.shape[0]))
+        _interp_rows(hs, zs, height, out)
+
+        np.testing.assert_allclose(
+            out, self._reference(height_sig, ze, height), equal_nan=True
+        )
+
+
+class TestExtractTime:
+    def test_matches_pd_to_datetime(self):
+        """
+        The datetime64 composition reproduces pd.to_datetime, including
+        leap days and year boundaries.
+        """
+
+        fields = pd.DataFrame(
+            {
+                "year": [2020, 2020, 2022, 2022],
+                "month": [2, 12, 1, 3],
+                "day": [29, 31, 1, 21],
+                "hour": [0, 23, 12, 6],
+                "minute": [0, 59, 30, 45],
+                "second": [0, 59, 15, 1],
+                "ms": [0, 999, 500, 250],
+            }
+        )
+
+        swath_data = {
+            "ScanTime": {
+                "Year": fields["year"].values,
+                "Month": fields["month"].values,
+                "DayOfMonth": fields["day"].values,
+                "Hour": fields["hour"].values,
+                "Minute": fields["minute"].values,
+                "Second": fields["second"].values,
+                "MilliSecond": fields["ms"].values,
+            }
+        }
+
+        time = extract_time(swath_data)
+
+        assert np.array_equal(
+            time.astype("datetime64[ms]"),
+            pd.to_datetime(fields).values.astype("datetime64[ms]"),
+        )
+
+
+class TestBitflags:
+    def test_pack_unpack_roundtrip(self):
+        rng = np.random.default_rng(3)
+        boolean_mask = rng.integers(0, 2, size=(5, 1000)).astype(bool)
+
+        bit_mask = pack_bit_mask(boolean_mask)
+        back = unpack_bit_mask(bit_mask, count=5)
+
+        assert bit_mask.dtype == np.uint8
+        assert np.array_equal(back.astype(bool), boolean_mask)
+
+    def test_pack_matches_manual_bits(self):
+        rng = np.random.default_rng(4)
+        boolean_mask = rng.integers(0, 2, size=(8, 300)).astype(bool)
+
+        bit_mask = pack_bit_mask(boolean_mask)
+        ref = np.zeros(300, dtype="uint8")
+        for i in range(8):
+            ref |= boolean_mask[i].astype("uint8") << i
+
+        assert np.array_equal(bit_mask, ref)
+
+    def test_flag_xarray_roundtrip(self):
+        rng = np.random.default_rng(5)
+        ds = xr.Dataset(
+            {
+                "ocean": ("time", rng.integers(0, 2, size=200).astype(bool)),
+                "land": ("time", rng.integers(0, 2, size=200).astype(bool)),
+                "ice": ("time", rng.integers(0, 2, size=200).astype(bool)),
+            }
+        )
+        expected = {v: ds[v].values.copy() for v in ["ocean", "land", "ice"]}
+
+        ds = write_flag_xarray(
+            ds,
+            bool_vars=["ocean", "land", "ice"],
+            bool_meanings=["ocean", "land", "ice"],
+            bit_mask_name="surf_type",
+        )
+
+        assert ds["surf_type"].dtype == np.uint8
+
+        ds = read_flag_xarray(ds, bit_mask_name="surf_type")
+
+        for v, values in expected.items():
+            assert np.array_equal(ds[v].values, values)